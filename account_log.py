@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Account Log
+Buffered append-only writers for the accounts CSV and success/failure logs,
+plus the created-accounts index used to skip emails on resume
+"""
+
+import csv
+import hashlib
+import logging
+import mmap
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Set, TextIO
+
+import config
+
+CSV_HEADER = ['Email', 'Password', 'First Name', 'Last Name', 'Birth Date']
+
+
+def _ensure_parent_dir(path: str):
+    """Create the directory holding `path` (SUCCESS_LOG_FILE/FAILED_LOG_FILE may point outside LOG_DIR)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+class AccountIndex:
+    """
+    Append-only index of created emails, for resume-safe dedup
+
+    Each email is stored as a fixed-width 8-byte SHA-256 prefix, so loading
+    is one mmap read into a set and adding is a single O_APPEND write.
+    """
+
+    RECORD_SIZE = 8
+
+    def __init__(self, path: str):
+        self.path = path
+        self._keys = self._load()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    @staticmethod
+    def _key(email: str) -> bytes:
+        return hashlib.sha256(email.strip().lower().encode('utf-8')).digest()[:AccountIndex.RECORD_SIZE]
+
+    def _load(self) -> Set[bytes]:
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return set()
+        size -= size % self.RECORD_SIZE  # Ignore a torn trailing record
+        if not size:
+            return set()
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {mm[i:i + self.RECORD_SIZE] for i in range(0, size, self.RECORD_SIZE)}
+
+    def __contains__(self, email: str) -> bool:
+        return self._key(email) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, email: str):
+        """Record an email (no-op if already present)"""
+        key = self._key(email)
+        if key not in self._keys:
+            os.write(self._fd, key)
+            self._keys.add(key)
+
+    def update(self, emails: Iterable[str]):
+        for email in emails:
+            self.add(email)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class AccountLog:
+    """Keeps the accounts CSV and log files open for the whole run"""
+
+    def __init__(self, output_file: str = config.OUTLOOK_ACCOUNTS_FILE):
+        self.output_file = output_file
+        self.lock = threading.Lock()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        # Write the header only for a new (or empty) CSV file
+        new_file = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+        self._csv_file = open(output_file, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+        self._csv = csv.writer(self._csv_file)
+        if new_file:
+            self._csv.writerow(CSV_HEADER)
+            self._csv_file.flush()
+            logging.info(f"Created new CSV file: {output_file}")
+        else:
+            logging.info(f"Appending to existing CSV file: {output_file}")
+
+        # Emails already created by this or earlier runs (seeded from the CSV if the index is new);
+        # nobody can close() a half-built instance, so release the handles here if this fails
+        index = None
+        try:
+            index = AccountIndex(f"{output_file}.idx")
+            if not len(index) and not new_file:
+                index.update(self._read_csv_emails(output_file))
+        except BaseException:
+            if index is not None:
+                index.close()
+            self._csv_file.close()
+            raise
+        self.index = index
+
+        # Success/failure logs are opened on their first record
+        self._log_files: Dict[str, TextIO] = {}
+
+    def log_success(self, account: Dict):
+        """Append a created account to the CSV and the success log"""
+        with self.lock:
+            self._csv.writerow([
+                account['email'],
+                account['password'],
+                account['first_name'],
+                account['last_name'],
+                account['birth_date']
+            ])
+            self.index.add(account['email'])
+            created_at = account.get('created_at') or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            success_file = self._log_file(config.SUCCESS_LOG_FILE)
+            success_file.write(f"{created_at} - {account['email']}\n")
+            self._commit(self._csv_file, success_file)
+
+    def __contains__(self, email: str) -> bool:
+        return email in self.index
+
+    @staticmethod
+    def _read_csv_emails(path: str) -> Iterable[str]:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Header
+            return [row[0] for row in reader if row]
+
+    def log_failure(self, reason: str):
+        """Append a failed attempt to the failure log"""
+        with self.lock:
+            failed_file = self._log_file(config.FAILED_LOG_FILE)
+            failed_file.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {reason}\n")
+            self._commit(failed_file)
+
+    def _log_file(self, path: str) -> TextIO:
+        """Open a log file on first use (creating its directory once per path)"""
+        f = self._log_files.get(path)
+        if f is None:
+            _ensure_parent_dir(path)
+            f = self._log_files[path] = open(path, 'a', encoding='utf-8', buffering=1 << 16)
+        return f
+
+    def _commit(self, *files):
+        """Hand the record to the OS now; fsync only every LOG_FLUSH_EVERY records or LOG_FLUSH_INTERVAL_S"""
+        for f in files:
+            f.flush()
+        self._pending += 1
+        if (self._pending >= config.LOG_FLUSH_EVERY or
+                time.monotonic() - self._last_sync >= config.LOG_FLUSH_INTERVAL_S):
+            self._sync()
+
+    def _sync(self):
+        """Flush and fsync all open files"""
+        for f in (self._csv_file, *self._log_files.values()):
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close all files"""
+        with self.lock:
+            if self._csv_file.closed:
+                return
+            self._sync()
+            for f in (self._csv_file, *self._log_files.values()):
+                f.close()
+            self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
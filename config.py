@@ -1,41 +1,356 @@
 # Configuration settings for Outlook Account Creator
 
-# Outlook settings
-OUTLOOK_ACCOUNTS_FILE = "outlook_accounts.csv"  # Created accounts stored here
-OUTLOOK_IMAP_SERVER = "outlook.office365.com"
-OUTLOOK_IMAP_PORT = 993
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Final, Optional, Tuple
 
-# Email domain
-EMAIL_DOMAIN = "outlook.com"
+# Optional override files next to this module, whatever the working directory (values here win over the defaults in Config)
+_CONFIG_DIR: Final = os.path.dirname(os.path.abspath(__file__))
+CONFIG_YAML_FILE: Final = os.path.join(_CONFIG_DIR, "outlook_config.yml")  # Requires PyYAML; keys are Config field names (any case)
+CONFIG_CACHE_FILE: Final = os.path.join(_CONFIG_DIR, ".outlook_config.cache.json")  # Parsed YAML, reused while the YAML is unchanged
+ENV_FILE: Final = os.path.join(_CONFIG_DIR, ".env")  # Same names as the env vars, e.g. OUTLOOK_HEADLESS_MODE=true (prefix optional)
+ENV_PREFIX: Final = "OUTLOOK_"  # Process env vars, e.g. OUTLOOK_HEADLESS_MODE=1, OUTLOOK_IMAP_PORT=993
 
-# Faker language/locale settings
-# Options: 'en_US' (English), 'pt_BR' (Portuguese Brazil), 'es_ES' (Spanish), etc.
-# See https://faker.readthedocs.io/en/master/locales.html for all available locales
-FAKER_LOCALE = "pt_BR"  # Default: Portuguese Brazil. Change to 'en_US' for English, 'es_ES' for Spanish, etc.
+try:
+    import orjson  # Optional: faster parsing of the JSON config cache
+except ImportError:
+    orjson = None
 
-# Password settings - FIXED PASSWORD FOR ALL ACCOUNTS
-FIXED_PASSWORD = "Outlook234!"  # Default password for all accounts (change as needed)
+# Module logger: logging.warning() at import time would configure the root logger early
+_log = logging.getLogger(__name__)
 
-# Proxy settings
-PROXY_FILE = "proxies.txt"  # One proxy per line (http://ip:port or socks5://ip:port)
-PROXY_TYPE = "http"  # Type: "http", "https", "socks4", or "socks5"
-USE_PROXIES_FOR_OUTLOOK = False  # Set to True to use proxies (recommended: use VPN instead)
+PROXY_TYPES: Final = ("http", "https", "socks4", "socks5")
+SCREENSHOT_LEVELS: Final = ("error", "always")
 
-# Browser settings
-HEADLESS_MODE = False  # Set to True to run browser in background
-DISABLE_IMAGES = False  # Set to True to speed up (but may affect CAPTCHA detection)
 
-# Timeout settings (in seconds)
-PAGE_LOAD_TIMEOUT = 30
-ELEMENT_WAIT_TIMEOUT = 15
+@dataclass(frozen=True)
+class Config:
+    """Immutable settings, built once at import time (see CONFIG below)"""
 
-# Output files
-LOG_DIR = "logs"
-SUCCESS_LOG_FILE = "logs/successful_accounts.log"
-FAILED_LOG_FILE = "logs/failed_accounts.log"
+    # Outlook settings
+    outlook_accounts_file: str = "outlook_accounts.csv"  # Created accounts stored here
+    outlook_imap_server: str = "outlook.office365.com"
+    outlook_imap_port: int = 993
 
-# How many accounts to create (None = unlimited, or set a number)
-TOTAL_ACCOUNTS = None
+    # Email domain
+    email_domain: str = "outlook.com"
 
-# Delay between account creations (in seconds)
-DELAY_BETWEEN_ACCOUNTS = 2
+    # Faker language/locale settings
+    # Options: 'en_US' (English), 'pt_BR' (Portuguese Brazil), 'es_ES' (Spanish), etc.
+    # See https://faker.readthedocs.io/en/master/locales.html for all available locales
+    faker_locale: str = "pt_BR"  # Default: Portuguese Brazil. Change to 'en_US' for English, 'es_ES' for Spanish, etc.
+
+    # Password settings - FIXED PASSWORD FOR ALL ACCOUNTS
+    fixed_password: str = "Outlook234!"  # Default password for all accounts (change as needed)
+
+    # Proxy settings
+    proxy_file: str = "proxies.txt"  # One proxy per line (http://ip:port or socks5://ip:port)
+    proxy_type: str = "http"  # Type: "http", "https", "socks4", or "socks5"
+    use_proxies_for_outlook: bool = False  # Set to True to use proxies (recommended: use VPN instead)
+
+    # Browser settings
+    headless_mode: bool = False  # Set to True to run browser in background
+    disable_images: bool = False  # Set to True to speed up (but may affect CAPTCHA detection)
+    # URL patterns blocked over CDP when disable_images is on (scripts/XHR stay allowed - the form needs them)
+    blocked_url_patterns: Tuple[str, ...] = (
+        "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+        "*google-analytics*", "*doubleclick*", "*facebook.net*",
+    )
+    screenshot_level: str = "error"  # "error" = only on failures, "always" = also after every signup step
+
+    # Timeout settings (in seconds)
+    page_load_timeout: int = 30
+    element_wait_timeout: int = 15
+
+    # Output files
+    log_dir: str = "logs"
+    success_log_file: str = "logs/successful_accounts.log"
+    failed_log_file: str = "logs/failed_accounts.log"
+    log_flush_every: int = 32  # fsync account/log files after this many records...
+    log_flush_interval_s: float = 1.0  # ...or once this many seconds have passed
+
+    # How many accounts to create (None = unlimited, or set a number)
+    total_accounts: Optional[int] = None
+
+    # Delay between account creations (in seconds)
+    delay_between_accounts: float = 2
+
+    def __post_init__(self):
+        """Reject override values that would only fail later, mid-signup"""
+        if self.proxy_type not in PROXY_TYPES:
+            raise ValueError(f"proxy_type must be one of {PROXY_TYPES}, got {self.proxy_type!r}")
+        if self.screenshot_level not in SCREENSHOT_LEVELS:
+            raise ValueError(f"screenshot_level must be one of {SCREENSHOT_LEVELS}, got {self.screenshot_level!r}")
+        if not 0 < self.outlook_imap_port < 65536:
+            raise ValueError(f"outlook_imap_port out of range: {self.outlook_imap_port}")
+        for name in ("page_load_timeout", "element_wait_timeout", "log_flush_every"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+        if self.delay_between_accounts < 0 or self.log_flush_interval_s < 0:
+            raise ValueError("delay_between_accounts and log_flush_interval_s must not be negative")
+        if self.total_accounts is not None and self.total_accounts < 0:
+            raise ValueError(f"total_accounts must be None or >= 0, got {self.total_accounts}")
+
+    @classmethod
+    def from_env(cls, base: Optional["Config"] = None, environ: Optional[Dict[str, str]] = None) -> "Config":
+        """
+        Apply OUTLOOK_* environment variables on top of `base` (defaults if None)
+
+        The environment is snapshotted once into a plain dict and every value
+        is coerced to its field type here, so callers only see typed values.
+        """
+        env = dict(os.environ if environ is None else environ)
+        overrides = {}
+        for f in fields(cls):
+            value = env.get(_env_name(f.name))
+            if value is not None:
+                overrides[f.name] = _coerce(f.name, value)
+        return replace(base if base is not None else cls(), **overrides)
+
+
+_FIELD_TYPES = {f.name: f.type for f in fields(Config)}
+
+
+_TRUE_STRINGS: Final = ("1", "true", "yes", "on")
+_FALSE_STRINGS: Final = ("0", "false", "no", "off", "")
+
+
+def _has_type(field_type: Any, value: Any) -> bool:
+    """True if a YAML scalar already has the field's type (bool is not accepted as a number)"""
+    if isinstance(value, bool):
+        return field_type is bool
+    if field_type in (int, Optional[int]):
+        return isinstance(value, int)
+    if field_type is float:
+        return isinstance(value, (int, float))
+    return field_type is str and isinstance(value, str)
+
+
+def _coerce(name: str, value: Any) -> Any:
+    """Convert a raw override (string from .env, or YAML scalar) to the field's type"""
+    field_type = _FIELD_TYPES[name]
+    if field_type == Tuple[str, ...]:
+        # Comma-separated string (env/.env) or YAML list
+        if isinstance(value, str):
+            items = value.split(",")
+        elif isinstance(value, (list, tuple)):
+            items = value
+        else:
+            raise ValueError(f"{name} must be a list or comma-separated string, got {value!r}")
+        return tuple(str(item).strip() for item in items if str(item).strip())
+    raw = value
+    if not isinstance(value, str):
+        if value is None and field_type is Optional[int]:
+            return None
+        if _has_type(field_type, value):
+            return float(value) if field_type is float else value
+        # YAML numbers for text fields (fixed_password: 12345678) go through the string path;
+        # anything else (booleans for text/numbers, lists, mappings) is a mistake
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} expects {getattr(field_type, '__name__', field_type)}, got {value!r}")
+        value = str(value)
+    if field_type is bool:
+        flag = value.strip().lower()
+        if flag in _TRUE_STRINGS:
+            return True
+        if flag in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"{name} expects bool, got {raw!r}")
+    try:
+        if field_type is Optional[int]:
+            return None if value.strip().lower() in ("", "none", "null") else int(value)
+        if field_type in (int, float):
+            return field_type(value)
+    except ValueError:
+        raise ValueError(f"{name} expects {getattr(field_type, '__name__', field_type)}, got {raw!r}") from None
+    return value
+
+
+def _normalize(raw: Dict[str, Any], source: str, strip_prefix: bool = False) -> Dict[str, Any]:
+    """
+    Map override keys (FIXED_PASSWORD / fixed_password) onto Config fields
+
+    With strip_prefix (.env files), keys may also carry the OUTLOOK_ prefix used
+    by environment variables, so lines copied from the shell work unchanged.
+    """
+    known = {f.name for f in fields(Config)}
+    prefix = ENV_PREFIX.lower()
+    overrides = {}
+    for key, value in raw.items():
+        name = str(key).lower()
+        if strip_prefix and name not in known and name.startswith(prefix):
+            name = name[len(prefix):]
+        if name not in known:
+            _log.warning(f"Ignoring unknown setting '{key}' in {source}")
+            continue
+        overrides[name] = _coerce(name, value)
+    return overrides
+
+
+def _load_yaml_overrides(path: str) -> Dict[str, Any]:
+    """Parse the YAML override file, reusing the JSON cache while its blake2b digest is unchanged"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return {}
+
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    try:
+        with open(CONFIG_CACHE_FILE, 'rb') as f:
+            cache_bytes = f.read()
+        cached = orjson.loads(cache_bytes) if orjson else json.loads(cache_bytes)
+        if cached.get("hash") == digest:
+            if not isinstance(cached["data"], dict):
+                raise ValueError(f"{CONFIG_CACHE_FILE} data must be a mapping, got {type(cached['data']).__name__}")
+            return cached["data"]
+    except ValueError as e:
+        # Unreadable or malformed cache: fall through and parse the YAML again (which rewrites it)
+        _log.warning(f"Ignoring config cache: {e}")
+    except (OSError, KeyError, AttributeError):
+        pass
+
+    try:
+        import yaml
+    except ImportError:
+        _log.warning(f"PyYAML not installed - ignoring {path}")
+        return {}
+    data = yaml.safe_load(raw)
+    if data is None:
+        data = {}
+    elif not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a mapping of setting: value, got {type(data).__name__}")
+
+    try:
+        tmp_path = f"{CONFIG_CACHE_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"hash": digest, "data": data}, f)
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
+    except (OSError, TypeError) as e:
+        _log.debug(f"Could not write config cache: {e}")
+    return data
+
+
+def _load_env_file(path: str) -> Dict[str, Any]:
+    """Read KEY=value pairs from a .env file without touching os.environ"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        _log.warning(f"python-dotenv not installed - ignoring {path}")
+        return {}
+    return {k: v for k, v in dotenv_values(path).items() if v is not None}
+
+
+def _env_name(name: str) -> str:
+    """Environment variable for a field (outlook_imap_port -> OUTLOOK_IMAP_PORT, headless_mode -> OUTLOOK_HEADLESS_MODE)"""
+    upper = name.upper()
+    return upper if upper.startswith(ENV_PREFIX) else ENV_PREFIX + upper
+
+
+@functools.lru_cache(maxsize=1)
+def _load() -> Config:
+    """Build the settings once: defaults, then YAML, then .env, then OUTLOOK_* env vars"""
+    overrides = _normalize(_load_yaml_overrides(CONFIG_YAML_FILE), CONFIG_YAML_FILE)
+    overrides.update(_normalize(_load_env_file(ENV_FILE), ENV_FILE, strip_prefix=True))
+    return Config.from_env(replace(Config(), **overrides))
+
+
+CONFIG = _load()
+
+# Module-level aliases (kept for `config.X` / `getattr(config, 'X', ...)` callers)
+OUTLOOK_ACCOUNTS_FILE: Final[str] = CONFIG.outlook_accounts_file
+OUTLOOK_IMAP_SERVER: Final[str] = sys.intern(CONFIG.outlook_imap_server)
+OUTLOOK_IMAP_PORT: Final[int] = CONFIG.outlook_imap_port
+EMAIL_DOMAIN: Final[str] = sys.intern(CONFIG.email_domain)
+FAKER_LOCALE: Final[str] = CONFIG.faker_locale
+FIXED_PASSWORD: Final[str] = CONFIG.fixed_password
+PROXY_FILE: Final[str] = CONFIG.proxy_file
+PROXY_TYPE: Final[str] = CONFIG.proxy_type
+USE_PROXIES_FOR_OUTLOOK: Final[bool] = CONFIG.use_proxies_for_outlook
+HEADLESS_MODE: Final[bool] = CONFIG.headless_mode
+DISABLE_IMAGES: Final[bool] = CONFIG.disable_images
+BLOCKED_URL_PATTERNS: Final[Tuple[str, ...]] = CONFIG.blocked_url_patterns
+SCREENSHOT_LEVEL: Final[str] = CONFIG.screenshot_level
+PAGE_LOAD_TIMEOUT: Final[int] = CONFIG.page_load_timeout
+ELEMENT_WAIT_TIMEOUT: Final[int] = CONFIG.element_wait_timeout
+LOG_DIR: Final[str] = CONFIG.log_dir
+SUCCESS_LOG_FILE: Final[str] = CONFIG.success_log_file
+FAILED_LOG_FILE: Final[str] = CONFIG.failed_log_file
+LOG_FLUSH_EVERY: Final[int] = CONFIG.log_flush_every
+LOG_FLUSH_INTERVAL_S: Final[float] = CONFIG.log_flush_interval_s
+TOTAL_ACCOUNTS: Final[Optional[int]] = CONFIG.total_accounts
+DELAY_BETWEEN_ACCOUNTS: Final[float] = CONFIG.delay_between_accounts
+
+# Email address suffix, built once
+EMAIL_SUFFIX: Final[str] = "@" + EMAIL_DOMAIN
+
+
+def make_email(username: str, _suffix: str = EMAIL_SUFFIX) -> str:
+    """Full email address for a username (e.g. 'johnsmith' -> 'johnsmith@outlook.com')"""
+    return username + _suffix
+
+
+def get_browser_options(prefs: Optional[Dict[str, Any]] = None):
+    """
+    Build a fresh uc.ChromeOptions carrying the config-driven Chrome prefs
+
+    undetected_chromedriver (and selenium with it) is imported on first call,
+    so `import config` stays cheap. A new object is returned every time
+    because uc.Chrome refuses to reuse an options instance.
+    """
+    import undetected_chromedriver as uc
+
+    options = uc.ChromeOptions()
+    prefs = dict(prefs or {})
+    if CONFIG.disable_images:
+        prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_argument('--blink-settings=imagesEnabled=false')
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+    return options
+
+
+def apply_resource_blocking(driver) -> None:
+    """
+    Second half of disable_images, for a started driver: block BLOCKED_URL_PATTERNS over CDP
+
+    get_browser_options() covers what Chrome prefs can do (images); fonts, media
+    and trackers can only be blocked once the browser is running. No-op when
+    disable_images is off; a CDP failure is logged and the page loads unblocked.
+    """
+    if not CONFIG.disable_images:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(CONFIG.blocked_url_patterns)})
+    except Exception as e:
+        _log.warning(f"Could not enable resource blocking: {e}")
+
+
+# Parsed proxy lists, keyed on (path, mtime_ns, size) so an unchanged file is read once
+_proxy_cache: Dict[tuple, Tuple[str, ...]] = {}
+
+
+def load_proxies(path: str = PROXY_FILE) -> Tuple[str, ...]:
+    """Load proxies from file (one per line, '#' comments skipped), cached until the file changes"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ()
+    key = (path, st.st_mtime_ns, st.st_size)
+    cached = _proxy_cache.get(key)
+    if cached is not None:
+        return cached
+    with open(path, 'r') as f:
+        proxies = tuple(line.strip() for line in f if line.strip() and not line.lstrip().startswith('#'))
+    _proxy_cache.clear()
+    _proxy_cache[key] = proxies
+    return proxies
@@ -4,26 +4,338 @@ Outlook Account Creator
 Automates creation of Outlook/Hotmail email accounts
 """
 
+import os
 import time
+import base64
 import random
-import string
+import itertools
 import logging
-import csv
-from typing import Dict, Optional, List
+import re
+from typing import Container, Dict, Optional, List, Tuple
 from datetime import datetime
 from faker import Faker
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+)
 import config
+from account_log import AccountLog
+
+
+# Page phrases, compiled once and matched case-insensitively without lowering the page text
+_TAKEN_RE = re.compile(r"already taken|try another|someone.{0,10}already", re.I)
+_CAPTCHA_RE = re.compile(r"prove you'?re human|let'?s prove", re.I)
+_SUCCESS_RE = re.compile(r"welcome|you'?re all set|inbox|get started", re.I)
+# URLs reached once signup went through (inbox, account page, proofs step, sign-in redirect)
+_SUCCESS_URL_RE = re.compile(r"outlook\.live\.com|account\.microsoft\.com|signup\.live\.com/proofs|/signup\?wa=wsignin")
+# keep_open's expanded list: the above plus Office webmail and the post-signup login redirect
+_KEEPOPEN_SUCCESS_URL_RE = re.compile(_SUCCESS_URL_RE.pattern + r"|outlook\.office\.com|login\.live\.com/login")
+
+
+NamePool = Tuple[Tuple[str, ...], Optional[Tuple[float, ...]]]
+
+
+def _name_pool(names) -> Optional[NamePool]:
+    """Split a Faker name list (tuple, or OrderedDict of name -> weight) into names + cumulative weights"""
+    if not names:
+        return None
+    if isinstance(names, dict):
+        return tuple(names), tuple(itertools.accumulate(names.values()))
+    return tuple(names), None
+
+
+def _draw_name(pool: Optional[NamePool]) -> Optional[str]:
+    """Pick one name from a pool, honouring Faker's weights when it has them"""
+    if pool is None:
+        return None
+    names, cum_weights = pool
+    if cum_weights:
+        return random.choices(names, cum_weights=cum_weights)[0]
+    return random.choice(names)
 
 
 class OutlookAccountCreator:
     """Creates Outlook/Hotmail email accounts"""
 
     SIGNUP_URL = "https://signup.live.com"
+    MAX_EMAIL_ATTEMPTS = 3  # Different emails tried when the username is taken
+    SCREENSHOT_DIR = "screenshots"
+
+    # Username (email) input
+    _USERNAME_SELECTORS = (
+        (By.NAME, "MemberName"),
+        (By.ID, "MemberName"),
+        (By.CSS_SELECTOR, "input[type='email']"),
+        (By.CSS_SELECTOR, "input[name='MemberName']"),
+        (By.XPATH, "//input[@type='email']"),
+    )
+
+    # Password input
+    _PASSWORD_SELECTORS = (
+        (By.NAME, "Password"),
+        (By.ID, "Password"),
+        (By.CSS_SELECTOR, "input[type='password']"),
+        (By.CSS_SELECTOR, "input[name='Password']"),
+        (By.XPATH, "//input[@type='password']"),
+    )
+
+    # Country dropdown (optional field)
+    _COUNTRY_SELECTORS = (
+        (By.ID, "Country"),
+        (By.NAME, "Country"),
+        (By.CSS_SELECTOR, "select[name='Country']"),
+    )
+
+    # DAY - Portuguese and English, with IDs
+    _DAY_SELECTORS = (
+        (By.ID, "BirthDayDropdown"),
+        (By.CSS_SELECTOR, "select[id='BirthDayDropdown']"),
+        (By.CSS_SELECTOR, "combobox[id='BirthDayDropdown']"),
+        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Dia' i]"),
+        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Day' i]"),
+        (By.NAME, "BirthDay"),
+        (By.CSS_SELECTOR, "select[name='BirthDay']"),
+        (By.CSS_SELECTOR, "select[id='BirthDay']"),
+        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Dia' i]"),
+        (By.CSS_SELECTOR, "button[aria-label*='Dia' i]"),
+        (By.CSS_SELECTOR, "div[aria-label*='Dia' i]"),
+        (By.CSS_SELECTOR, "button[aria-label*='Day' i]"),
+    )
+
+    # MONTH - Portuguese and English
+    _MONTH_SELECTORS = (
+        (By.ID, "BirthMonthDropdown"),
+        (By.CSS_SELECTOR, "select[id='BirthMonthDropdown']"),
+        (By.CSS_SELECTOR, "combobox[id='BirthMonthDropdown']"),
+        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Mês' i]"),
+        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Month' i]"),
+        (By.NAME, "BirthMonth"),
+        (By.CSS_SELECTOR, "select[name='BirthMonth']"),
+        (By.CSS_SELECTOR, "select[id='BirthMonth']"),
+        (By.CSS_SELECTOR, "button[aria-label*='Mês' i]"),
+        (By.CSS_SELECTOR, "div[aria-label*='Mês' i]"),
+        (By.CSS_SELECTOR, "button[aria-label*='Month' i]"),
+    )
+
+    # YEAR
+    _YEAR_SELECTORS = (
+        (By.NAME, "BirthYear"),
+        (By.ID, "BirthYear"),
+        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Ano' i]"),
+        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Year' i]"),
+        (By.CSS_SELECTOR, "select[name='BirthYear']"),
+        (By.CSS_SELECTOR, "select[id='BirthYear']"),
+        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Ano' i]"),
+        (By.CSS_SELECTOR, "input[aria-label*='Ano' i]"),
+        (By.CSS_SELECTOR, "input[aria-label*='Year' i]"),
+    )
+
+    # First name input
+    _FIRST_NAME_SELECTORS = (
+        (By.CSS_SELECTOR, "input[aria-label*='First' i]"),
+        (By.NAME, "FirstName"),
+        (By.ID, "FirstName"),
+        (By.CSS_SELECTOR, "input[name='FirstName']"),
+        (By.CSS_SELECTOR, "input[type='text']:first-of-type"),
+        (By.XPATH, "//label[contains(text(), 'First')]/following-sibling::input"),
+        (By.XPATH, "//input[contains(@placeholder, 'First')]"),
+        (By.XPATH, "//input[@type='text'][1]"),
+    )
+
+    # Last name input (fallbacks when there is no 2nd text input)
+    _LAST_NAME_SELECTORS = (
+        (By.CSS_SELECTOR, "input[aria-label*='Last' i]"),
+        (By.NAME, "LastName"),
+        (By.XPATH, "//label[contains(text(), 'Last')]/following-sibling::input"),
+        (By.ID, "LastName"),
+        (By.CSS_SELECTOR, "input[name='LastName']"),
+    )
+
+    # Next/Avançar button - English and Portuguese
+    _NEXT_SELECTORS = (
+        (By.ID, "iSignupAction"),
+        (By.CSS_SELECTOR, "button[type='submit']"),
+        (By.CSS_SELECTOR, "input[type='submit']"),
+        (By.XPATH, "//button[contains(text(), 'Next')]"),  # English
+        (By.XPATH, "//button[contains(text(), 'Avançar')]"),  # Portuguese
+        (By.XPATH, "//button[contains(@class, 'fui-Button') and contains(text(), 'Avançar')]"),  # Portuguese with class
+        (By.XPATH, "//button[contains(@class, 'fui-Button') and contains(text(), 'Next')]"),  # English with class
+        (By.XPATH, "//input[@type='submit']"),
+        (By.XPATH, "//input[@value='Next']"),
+        (By.XPATH, "//input[@value='Avançar']"),
+    )
+    # Catch-all Next candidates (match Back / sign-in options too), probed only after the specific
+    # selectors and the text fallback have failed - never in the same tick as the real Next button
+    _NEXT_FALLBACK_SELECTORS = (
+        (By.CSS_SELECTOR, "button.fui-Button"),  # Any button with fui-Button class
+    )
+
+    # Realistic user preferences (compatible with all Chrome versions)
+    _CHROME_PREFS = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "profile.default_content_setting_values.notifications": 2
+    }
+
+    # Fixed Chrome flags; the proxy flag is added per instance
+    _CHROME_ARGS = (
+        # Performance optimizations
+        '--disable-gpu',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-background-networking',
+        '--disable-sync',
+        '--disable-default-apps',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-extensions',
+        '--disable-features=Translate,MediaRouter',
+        # Memory: the session is thrown away after one signup, so caches are wasted
+        '--disk-cache-size=1',
+        '--media-cache-size=1',
+        # Suppress errors and warnings
+        '--log-level=3',
+        # Additional stealth options to avoid detection
+        '--disable-blink-features=AutomationControlled',
+        '--window-size=1920,1080',
+        '--start-maximized',
+    )
+
+    # Username validation error ("already taken" / "try another"). Generic alert regions are often
+    # rendered empty or carry unrelated text, so they only count when the text matches _TAKEN_RE;
+    # the field's own error elements count whenever they show text.
+    _EMAIL_ERROR_CSS = "#usernameError, #MemberNameError, [role='alert'], .alert-error"
+    _EMAIL_FIELD_ERROR_CSS = "#usernameError, #MemberNameError"
+    _EMAIL_ERROR_JS = """
+        const taken = new RegExp(arguments[1], 'i');
+        for (const element of document.querySelectorAll(arguments[0])) {
+            if (element.offsetParent === null && !element.getClientRects().length) continue;
+            const text = (element.innerText || '').trim();
+            if (text && (taken.test(text) || element.matches(arguments[2]))) return text;
+        }
+        return null;
+    """
+
+    # Month names for DOB option lookup, indexed by birth_month - 1
+    _MONTH_NAMES_PT = ('janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
+                       'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro')
+    _MONTH_NAMES_EN = ('January', 'February', 'March', 'April', 'May', 'June',
+                       'July', 'August', 'September', 'October', 'November', 'December')
+
+    # Checks a list of [by, value] selectors in one round-trip; returns [index, element] of the first hit
+    _FIND_ANY_JS = """
+        const [selectors, clickable] = arguments;
+        const usable = el => el && el.nodeType === 1 && (!clickable || (
+            el.getClientRects().length > 0 &&
+            getComputedStyle(el).visibility !== 'hidden' &&
+            !el.disabled));
+        for (let i = 0; i < selectors.length; i++) {
+            const [by, value] = selectors[i];
+            let candidates;
+            try {
+                if (by === 'id') {
+                    candidates = [document.getElementById(value)];
+                } else if (by === 'name') {
+                    candidates = Array.from(document.getElementsByName(value));
+                } else if (by === 'tag name') {
+                    candidates = Array.from(document.getElementsByTagName(value));
+                } else if (by === 'xpath') {
+                    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    candidates = [];
+                    for (let k = 0; k < result.snapshotLength; k++) candidates.push(result.snapshotItem(k));
+                } else {
+                    candidates = Array.from(document.querySelectorAll(value));
+                }
+            } catch (e) {
+                continue;  // Invalid selector for this page/browser
+            }
+            const hit = candidates.find(usable);
+            if (hit) return [i, hit];
+        }
+        return null;
+    """
+
+    # Clicks the first visible, enabled button whose text mentions Next/Avançar; returns [element, text]
+    _CLICK_NEXT_TEXT_JS = """
+        for (const btn of document.querySelectorAll('button')) {
+            const text = (btn.innerText || '').trim();
+            if (!text.includes('Next') && !text.includes('Avançar')) continue;
+            if (btn.disabled || !btn.getClientRects().length) continue;
+            btn.scrollIntoView({block: 'center'});
+            btn.click();
+            return [btn, text];
+        }
+        return null;
+    """
+
+    # CAPTCHA markers: prompt text (arguments[0] = _CAPTCHA_RE pattern), enforcement frame, verification elements
+    _CAPTCHA_STATE_JS = """
+        const text = (document.body && document.body.innerText) || '';
+        return {
+            human: new RegExp(arguments[0], 'i').test(text),
+            frame: !!document.getElementById('enforcementFrame'),
+            verification: !!document.querySelector("[aria-label*='verification' i], [aria-label*='captcha' i]")
+        };
+    """
+
+    # Opens a custom combobox and clicks the matching option, polling until it renders
+    # arguments: element, exact labels, substring labels, timeout ms, callback
+    _PICK_OPTION_JS = """
+        const [element, exact, contains, timeoutMs, done] = arguments;
+        const wanted = contains.map(label => label.toLowerCase());
+        const matches = opt => {
+            const text = (opt.textContent || '').trim();
+            const ariaLabel = opt.getAttribute('aria-label');
+            return exact.includes(text) || exact.includes(ariaLabel) ||
+                wanted.some(label => text.toLowerCase().includes(label));
+        };
+        const findOption = () => {
+            for (const css of ['[role="option"]', 'option, li', 'div']) {
+                const option = Array.from(document.querySelectorAll(css)).find(matches);
+                if (option) return option;
+            }
+            return null;
+        };
+        element.scrollIntoView({block: 'center'});
+        element.click();
+        const deadline = Date.now() + timeoutMs;
+        (function poll() {
+            const option = findOption();
+            if (option) {
+                option.click();
+                done(true);
+            } else if (Date.now() > deadline) {
+                done(false);
+            } else {
+                setTimeout(poll, 50);
+            }
+        })();
+    """
+
+    # Button/input summary for the DOB debug log, gathered in one round-trip
+    _DEBUG_FORM_JS = """
+        const buttons = Array.from(document.querySelectorAll('button'));
+        const inputs = Array.from(document.querySelectorAll('input'));
+        return {
+            buttons: buttons.length,
+            inputs: inputs.length,
+            comboboxes: document.querySelectorAll("div[role='combobox']").length,
+            button_details: buttons.slice(0, 5).map(b => ({
+                'text': (b.innerText || '').slice(0, 30) || 'no-text',
+                'aria-label': b.getAttribute('aria-label'),
+                'class': (b.getAttribute('class') || '').slice(0, 50) || 'no-class'
+            })),
+            input_details: inputs.slice(0, 5).map(i => ({
+                'name': i.getAttribute('name'),
+                'type': i.getAttribute('type'),
+                'aria-label': i.getAttribute('aria-label'),
+                'placeholder': i.getAttribute('placeholder')
+            }))
+        };
+    """
 
     def __init__(self, proxy: Optional[str] = None, headless: bool = True, locale: Optional[str] = None):
         """
@@ -40,39 +352,26 @@ class OutlookAccountCreator:
         self.faker = Faker(faker_locale)
         self.proxy = proxy
         self.headless = headless
+        # Snapshot Faker's name lists once; drawing from them skips Faker's provider dispatch per name
+        person = self.faker.provider('faker.providers.person')
+        self._first_names = _name_pool(getattr(person, 'first_names', None))
+        self._last_names = _name_pool(getattr(person, 'last_names', None))
+        # Emails created by earlier runs (set by create_bulk_accounts from the accounts index)
+        self.known_emails: Container[str] = frozenset()
+        self._screenshot_dir_ready = False
+        # (email, reason) of the last create_account call that returned None, for the failure log
+        self.last_failure: Tuple[Optional[str], str] = (None, '')
         logging.info(f"Faker initialized with locale: {faker_locale}")
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
 
     def _create_browser(self) -> uc.Chrome:
         """Create undetected Chrome browser instance with proxy support"""
-        options = uc.ChromeOptions()
-
-        # Performance optimizations
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-
-        # Suppress errors and warnings
-        options.add_argument('--log-level=3')
+        options = config.get_browser_options(self._CHROME_PREFS)
 
-        # Additional stealth options to avoid detection
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--start-maximized')
+        # Return from driver.get() at DOMContentLoaded - the form is usable before images/beacons finish
+        options.page_load_strategy = 'eager'
 
-        # Set realistic user preferences (compatible with all Chrome versions)
-        try:
-            prefs = {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "profile.default_content_setting_values.notifications": 2
-            }
-            options.add_experimental_option("prefs", prefs)
-        except:
-            pass  # Older Chrome versions may not support this
+        for argument in self._CHROME_ARGS:
+            options.add_argument(argument)
 
         # Proxy configuration
         use_proxies = getattr(config, 'USE_PROXIES_FOR_OUTLOOK', True)
@@ -112,23 +411,72 @@ class OutlookAccountCreator:
             '''
         })
 
+        # Skip fonts, media and trackers too when DISABLE_IMAGES is on (images are off via get_browser_options)
+        config.apply_resource_blocking(driver)
+
         driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        # All waiting is explicit (WebDriverWait / _find_any); an implicit wait would stack on top of it
+        driver.implicitly_wait(0)
         return driver
 
+    def _first_name(self) -> str:
+        """Random first name from the cached locale pool (falls back to Faker)"""
+        return _draw_name(self._first_names) or self.faker.first_name()
+
+    def _last_name(self) -> str:
+        """Random last name from the cached locale pool (falls back to Faker)"""
+        return _draw_name(self._last_names) or self.faker.last_name()
+
     def generate_username(self) -> str:
         """Generate a random username for Outlook"""
-        # Use faker for realistic names
-        first = self.faker.first_name().lower()
-        last = self.faker.last_name().lower()
+        # Use faker's name lists for realistic names
+        first = self._first_name().lower()
+        last = self._last_name().lower()
 
         # Add random numbers for uniqueness
-        random_num = ''.join(random.choices(string.digits, k=4))
+        random_num = f"{random.randrange(10000):04d}"
 
         # Format: firstnamelastname1234
         username = f"{first}{last}{random_num}"
 
         return username
 
+    def _email_for_name(self, first_name: str, last_name: str, max_draws: int = 10) -> Optional[str]:
+        """
+        Build firstnamelastname + first 4 letters of a random second last name
+
+        Re-draws the second last name while the email is in self.known_emails,
+        so an email already created by an earlier run never costs a browser session.
+        Returns None if every one of the `max_draws` draws was already created.
+        """
+        prefix = f"{first_name.lower()}{last_name.lower()}"
+        for _ in range(max_draws):
+            second_last_name = self._last_name().lower()
+            # Take first 4 letters, or pad if shorter
+            second_last_4 = (second_last_name[:4] if len(second_last_name) >= 4
+                             else second_last_name + 'x' * (4 - len(second_last_name)))[:4]
+            email = config.make_email(f"{prefix}{second_last_4}")
+            if email not in self.known_emails:
+                return email
+            logging.info(f"Skipping already-created email: {email}")
+        return None
+
+    def _email_candidates(self, first_name: str, last_name: str, count: int) -> List[str]:
+        """Draw up to `count` distinct unused emails for one name (fewer, possibly none, if the pool runs dry)"""
+        emails = []
+        for _ in range(count * 3):
+            email = self._email_for_name(first_name, last_name)
+            if email and email not in emails:
+                emails.append(email)
+                if len(emails) == count:
+                    break
+        return emails
+
+    def _failed(self, email: Optional[str], reason: str) -> None:
+        """Record why create_account gave up (read back by create_bulk_accounts) and return None"""
+        self.last_failure = (email, reason)
+        return None
+
     def generate_password(self) -> str:
         """Generate password (returns fixed password from config)"""
         return config.FIXED_PASSWORD
@@ -149,22 +497,20 @@ class OutlookAccountCreator:
             self.proxy = proxy
 
         driver = None
+        email = None
+        self.last_failure = (None, '')
         try:
             # Generate account details - generate name first, then use it for email
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            
-            # Generate second last name (4 letters) for email uniqueness
-            second_last_name = self.faker.last_name().lower()
-            # Take first 4 letters, or pad if shorter
-            second_last_4 = (second_last_name[:4] if len(second_last_name) >= 4 
-                            else second_last_name + 'x' * (4 - len(second_last_name)))[:4]
-            
-            # Generate username from the same name (lowercase, no spaces, with second last name)
-            first_lower = first_name.lower()
-            last_lower = last_name.lower()
-            username = f"{first_lower}{last_lower}{second_last_4}"
+            first_name = self._first_name()
+            last_name = self._last_name()
             
+            # Emails from the same name plus a 4-letter second last name (skips already-created emails),
+            # drawn up front for every retry so the retry loop does no Faker work
+            emails = self._email_candidates(first_name, last_name, self.MAX_EMAIL_ATTEMPTS)
+            if not emails:
+                logging.error(f"No unused email left for {first_name} {last_name}")
+                return self._failed(None, 'No unused email left')
+
             password = self.generate_password()
 
             # Random birth date (age 18-50)
@@ -172,10 +518,7 @@ class OutlookAccountCreator:
             birth_month = random.randint(1, 12)
             birth_day = random.randint(1, 28)
 
-            # Full email address with domain
-            email = f"{username}@outlook.com"
-
-            logging.info(f"Creating Outlook account: {email}")
+            logging.info(f"Creating Outlook account: {emails[0]}")
             logging.info(f"Name: {first_name} {last_name}")
 
             # Create browser
@@ -185,727 +528,36 @@ class OutlookAccountCreator:
             logging.info("Loading Outlook signup page...")
             driver.get(self.SIGNUP_URL)
 
-            wait = WebDriverWait(driver, config.ELEMENT_WAIT_TIMEOUT)
-            wait_short = WebDriverWait(driver, 3)  # Shorter wait for trying multiple selectors
+            # STEPS 1-2: email/username, then password (both fatal on failure)
+            email, error = self._step_email(driver, emails)
+            if error:
+                return self._failed(emails[0], error)
+            error = self._step_password(driver, password)
+            if error:
+                return self._failed(email, error)
 
-            # STEP 1: Enter email/username
-            logging.info("Step 1: Entering email/username...")
-
-            # Take screenshot of initial page
-            self._take_screenshot(driver, "step1_initial_page")
-            logging.info(f"Current URL: {driver.current_url}")
-
-            try:
-                # Try multiple selectors for username input
-                username_input = None
-                selectors = [
-                    (By.NAME, "MemberName"),
-                    (By.ID, "MemberName"),
-                    (By.CSS_SELECTOR, "input[type='email']"),
-                    (By.CSS_SELECTOR, "input[name='MemberName']"),
-                    (By.XPATH, "//input[@type='email']")
-                ]
-
-                for selector_type, selector_value in selectors:
-                    try:
-                        username_input = wait_short.until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        logging.info(f"✓ Found username input with: {selector_type} = {selector_value}")
-                        break
-                    except:
-                        continue
-
-                if not username_input:
-                    logging.error("Could not find username input field with any selector")
-                    self._take_screenshot(driver, "error_no_username_field")
-                    return None
-
-                # Try up to 3 different emails if username is taken
-                max_email_attempts = 3
-                email_accepted = False
-                
-                for attempt in range(max_email_attempts):
-                    if attempt > 0:
-                        # Generate new email for retry - keep same name, just change second last name
-                        second_last_name = self.faker.last_name().lower()
-                        second_last_4 = (second_last_name[:4] if len(second_last_name) >= 4 
-                                        else second_last_name + 'x' * (4 - len(second_last_name)))[:4]
-                        first_lower = first_name.lower()
-                        last_lower = last_name.lower()
-                        username = f"{first_lower}{last_lower}{second_last_4}"
-                        email = f"{username}@outlook.com"
-                        logging.info(f"Attempt {attempt + 1}: Trying new email: {email}")
-                    
-                    username_input.clear()
-                    username_input.send_keys(email)
-                    logging.info(f"✓ Entered email: {email}")
-                    time.sleep(1)  # Wait for validation
-
-                    # Check for "username already taken" error
-                    try:
-                        page_text = driver.find_element(By.TAG_NAME, "body").text
-                        if "already taken" in page_text.lower() or "try another" in page_text.lower():
-                            logging.warning(f"⚠ Email {email} is already taken!")
-                            self._take_screenshot(driver, f"email_taken_attempt{attempt+1}")
-                            
-                            if attempt < max_email_attempts - 1:
-                                logging.info("Will try with a different email...")
-                                continue
-                            else:
-                                logging.error(f"Failed after {max_email_attempts} email attempts")
-                                return None
-                        else:
-                            # No error detected - email accepted
-                            email_accepted = True
-                            break
-                    except:
-                        # If we can't check for errors, assume email is accepted
-                        email_accepted = True
-                        break
-
-                if not email_accepted:
-                    logging.error("Could not find available email username")
-                    return None
-
-                time.sleep(0.2)  # Reduced from 0.5s
-
-                # Click Next button using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after email"):
-                    logging.error("Could not find Next button with any selector")
-                    self._take_screenshot(driver, "error_next_button")
-                    return None
-                
-                time.sleep(1)  # Wait for page to load
-                
-                # After clicking Next, check again for email error
-                time.sleep(1)
-                try:
-                    page_text = driver.find_element(By.TAG_NAME, "body").text
-                    current_url = driver.current_url
-                    
-                    if "signup.live.com" in current_url and "MemberName" in current_url:
-                        if "already taken" in page_text.lower():
-                            logging.error("Email was rejected after clicking Next")
-                            self._take_screenshot(driver, "email_rejected_after_next")
-                            return None
-                except:
-                    pass
-
-            except Exception as e:
-                logging.error(f"Failed at step 1 (username): {e}")
-                self._take_screenshot(driver, "error_step1")
-                logging.error(f"Page source length: {len(driver.page_source)}")
-                return None
-
-            # STEP 2: Enter password
-            logging.info("Step 2: Entering password...")
-            self._take_screenshot(driver, "step2_password_page")
-
-            try:
-                # Try multiple selectors for password input
-                password_input = None
-                password_selectors = [
-                    (By.NAME, "Password"),
-                    (By.ID, "Password"),
-                    (By.CSS_SELECTOR, "input[type='password']"),
-                    (By.CSS_SELECTOR, "input[name='Password']"),
-                    (By.XPATH, "//input[@type='password']")
-                ]
-
-                for selector_type, selector_value in password_selectors:
-                    try:
-                        password_input = wait_short.until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        logging.info(f"✓ Found password input with: {selector_type} = {selector_value}")
-                        break
-                    except:
-                        continue
-
-                if not password_input:
-                    logging.error("Could not find password input field with any selector")
-                    self._take_screenshot(driver, "error_no_password_field")
-                    return None
-
-                password_input.clear()
-                password_input.send_keys(password)
-                logging.info(f"✓ Entered password")
-                time.sleep(0.5)  # Wait for password validation
-
-                # Click Next button using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after password"):
-                    logging.error("Could not find Next button after password")
-                    self._take_screenshot(driver, "error_next_button_step2")
-                    return None
-                
-                time.sleep(1)  # Wait for next page to load
-
-            except Exception as e:
-                logging.error(f"Failed at step 2 (password): {e}")
-                self._take_screenshot(driver, "error_step2")
-                return None
-
-            # STEP 3: Enter Country and DOB (this comes before name!)
-            logging.info("Step 3: Entering Country and DOB...")
-            time.sleep(0.5)  # Reduced from 1s
-            self._take_screenshot(driver, "step3_country_dob_page")
-
-            try:
-                logging.info(f"Current URL: {driver.current_url}")
-                logging.info(f"Page title: {driver.title}")
-
-                # Print visible text on page (first 500 chars) for debugging
-                try:
-                    body_text = driver.find_element(By.TAG_NAME, "body").text
-                    logging.info(f"Page text preview: {body_text[:500]}")
-                except:
-                    pass
-
-                # Try to find and select Country dropdown (optional)
-                country_found = False
-                country_selectors = [
-                    (By.ID, "Country"),
-                    (By.NAME, "Country"),
-                    (By.CSS_SELECTOR, "select[name='Country']")
-                ]
-
-                for selector_type, selector_value in country_selectors:
-                    try:
-                        country_select = Select(driver.find_element(selector_type, selector_value))
-                        country_select.select_by_value("US")
-                        logging.info("✓ Selected country: US")
-                        country_found = True
-                        break
-                    except:
-                        continue
-
-                if not country_found:
-                    logging.info("No country field found (may not be required)")
-
-                # Enter birth date - Using improved selectors based on TypeScript reference
-                dob_entered = False
-
-                # Wait for DOB fields to load
-                try:
-                    logging.info("Waiting for DOB fields to load...")
-                    time.sleep(1.5)  # Give page time to fully render
-
-                    # DAY - Improved selectors (Portuguese and English, with IDs)
-                    day_selectors = [
-                        (By.ID, "BirthDayDropdown"),
-                        (By.CSS_SELECTOR, "select[id='BirthDayDropdown']"),
-                        (By.CSS_SELECTOR, "combobox[id='BirthDayDropdown']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Day' i]"),
-                        (By.NAME, "BirthDay"),
-                        (By.CSS_SELECTOR, "select[name='BirthDay']"),
-                        (By.CSS_SELECTOR, "select[id='BirthDay']"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "div[aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Day' i]"),
-                    ]
-
-                    day_element = None
-                    found_day_selector = None
-                    for selector_type, selector_value in day_selectors:
-                        try:
-                            day_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            found_day_selector = (selector_type, selector_value)
-                            logging.info(f"✓ Found day field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not day_element:
-                        logging.error("Could not find day field with any selector")
-                        self._take_screenshot(driver, "error_day_field_not_found")
-                        raise Exception("Could not find Day field")
-
-                    # Check if it's a select or combobox
-                    tag_name = day_element.tag_name.lower()
-                    day_selected = False
-
-                    if tag_name == 'select':
-                        # HTML select - use Select class
-                        logging.info("Day field is HTML select, using Select class")
-                        try:
-                            select = Select(day_element)
-                            select.select_by_value(str(birth_day))
-                            day_selected = True
-                            logging.info(f"✓ Selected day {birth_day} via Select")
-                        except:
-                            try:
-                                select.select_by_visible_text(str(birth_day))
-                                day_selected = True
-                                logging.info(f"✓ Selected day {birth_day} via visible text")
-                            except Exception as e:
-                                logging.error(f"Error selecting day via Select: {e}")
-                    else:
-                        # Custom combobox - click and select option
-                        logging.info("Day field is custom combobox, clicking and selecting option")
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", day_element)
-                        time.sleep(0.2)
-                        driver.execute_script("arguments[0].click();", day_element)
-                        time.sleep(0.5)
-
-                        # Try to find and click the day option
-                        day_value = str(birth_day)
-                        day_option_selectors = [
-                            (By.XPATH, f"//*[@role='option'][@aria-label='{day_value}']"),
-                            (By.XPATH, f"//*[@role='option'][text()='{day_value}']"),
-                            (By.XPATH, f"//option[@value='{day_value}']"),
-                            (By.XPATH, f"//li[text()='{day_value}']"),
-                            (By.XPATH, f"//div[text()='{day_value}']"),
-                            (By.XPATH, f"//*[text()='{day_value}']"),
-                        ]
-
-                        for opt_type, opt_value in day_option_selectors:
-                            try:
-                                day_option = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((opt_type, opt_value))
-                                )
-                                day_option.click()
-                                day_selected = True
-                                logging.info(f"✓ Selected day {day_value}")
-                                break
-                            except:
-                                continue
-
-                        # Fallback: JavaScript search
-                        if not day_selected:
-                            logging.warn("Trying JavaScript fallback for day selection")
-                            clicked = driver.execute_script("""
-                                const options = Array.from(document.querySelectorAll('[role="option"], option, li, div'));
-                                const dayOption = options.find(opt => {
-                                    const text = opt.textContent?.trim();
-                                    const ariaLabel = opt.getAttribute('aria-label');
-                                    return text === arguments[0] || ariaLabel === arguments[0];
-                                });
-                                if (dayOption) {
-                                    dayOption.click();
-                                    return true;
-                                }
-                                return false;
-                            """, day_value)
-                            if clicked:
-                                day_selected = True
-                                logging.info(f"✓ Selected day {day_value} via JavaScript")
-
-                    if not day_selected:
-                        raise Exception(f"Could not select day {birth_day}")
-
-                    time.sleep(0.3)
-
-                    # MONTH - Improved selectors with Portuguese month names
-                    month_selectors = [
-                        (By.ID, "BirthMonthDropdown"),
-                        (By.CSS_SELECTOR, "select[id='BirthMonthDropdown']"),
-                        (By.CSS_SELECTOR, "combobox[id='BirthMonthDropdown']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Month' i]"),
-                        (By.NAME, "BirthMonth"),
-                        (By.CSS_SELECTOR, "select[name='BirthMonth']"),
-                        (By.CSS_SELECTOR, "select[id='BirthMonth']"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "div[aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Month' i]"),
-                    ]
-
-                    month_names_pt = ['', 'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
-                                      'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro']
-                    month_names_en = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                                     'July', 'August', 'September', 'October', 'November', 'December']
-                    
-                    month_name_pt = month_names_pt[birth_month]
-                    month_name_en = month_names_en[birth_month]
-                    month_num = str(birth_month)
-
-                    month_element = None
-                    for selector_type, selector_value in month_selectors:
-                        try:
-                            month_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            logging.info(f"✓ Found month field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not month_element:
-                        raise Exception("Could not find Month field")
-
-                    tag_name = month_element.tag_name.lower()
-                    month_selected = False
-
-                    if tag_name == 'select':
-                        # HTML select
-                        logging.info("Month field is HTML select")
-                        try:
-                            select = Select(month_element)
-                            select.select_by_value(month_num)
-                            month_selected = True
-                            logging.info(f"✓ Selected month {month_num} via Select")
-                        except:
-                            try:
-                                select.select_by_visible_text(month_name_pt)
-                                month_selected = True
-                                logging.info(f"✓ Selected month {month_name_pt} via Select")
-                            except:
-                                try:
-                                    select.select_by_visible_text(month_name_en)
-                                    month_selected = True
-                                    logging.info(f"✓ Selected month {month_name_en} via Select")
-                                except Exception as e:
-                                    logging.error(f"Error selecting month via Select: {e}")
-                    else:
-                        # Custom combobox
-                        logging.info("Month field is custom combobox")
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", month_element)
-                        time.sleep(0.2)
-                        driver.execute_script("arguments[0].click();", month_element)
-                        time.sleep(0.5)
-
-                        # Try Portuguese first, then English, then number
-                        month_option_selectors = [
-                            (By.XPATH, f"//*[@role='option'][contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//*[@role='option'][contains(text(), '{month_name_en}')]"),
-                            (By.XPATH, f"//*[@role='option'][text()='{month_num}']"),
-                            (By.XPATH, f"//*[contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//*[contains(text(), '{month_name_en}')]"),
-                            (By.XPATH, f"//li[contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//div[contains(text(), '{month_name_pt}')]"),
-                        ]
-
-                        for opt_type, opt_value in month_option_selectors:
-                            try:
-                                month_option = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((opt_type, opt_value))
-                                )
-                                month_option.click()
-                                month_selected = True
-                                logging.info(f"✓ Selected month {month_name_pt}")
-                                break
-                            except:
-                                continue
-
-                        # JavaScript fallback
-                        if not month_selected:
-                            clicked = driver.execute_script("""
-                                const options = Array.from(document.querySelectorAll('[role="option"], option, li, div'));
-                                const monthOption = options.find(opt => {
-                                    const text = opt.textContent?.toLowerCase().trim();
-                                    return text.includes(arguments[0].toLowerCase()) || text === arguments[1];
-                                });
-                                if (monthOption) {
-                                    monthOption.click();
-                                    return true;
-                                }
-                                return false;
-                            """, month_name_pt, month_num)
-                            if clicked:
-                                month_selected = True
-                                logging.info(f"✓ Selected month via JavaScript")
-
-                    if not month_selected:
-                        raise Exception(f"Could not select month {birth_month}")
-
-                    time.sleep(0.3)
-
-                    # YEAR - Improved selectors
-                    year_selectors = [
-                        (By.NAME, "BirthYear"),
-                        (By.ID, "BirthYear"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Year' i]"),
-                        (By.CSS_SELECTOR, "select[name='BirthYear']"),
-                        (By.CSS_SELECTOR, "select[id='BirthYear']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[aria-label*='Year' i]"),
-                    ]
-
-                    year_element = None
-                    for selector_type, selector_value in year_selectors:
-                        try:
-                            year_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            logging.info(f"✓ Found year field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not year_element:
-                        raise Exception("Could not find Year field")
-
-                    tag_name = year_element.tag_name.lower()
-                    year_filled = False
-
-                    if tag_name == 'select':
-                        # HTML select
-                        select = Select(year_element)
-                        select.select_by_value(str(birth_year))
-                        year_filled = True
-                        logging.info(f"✓ Selected year {birth_year} via Select")
-                    else:
-                        # Input field
-                        year_element.clear()
-                        year_element.send_keys(str(birth_year))
-                        year_filled = True
-                        logging.info(f"✓ Entered year {birth_year}")
-
-                    if not year_filled:
-                        raise Exception(f"Could not fill year {birth_year}")
-
-                    dob_entered = True
-                    logging.info(f"✓ Successfully entered complete DOB: {birth_day}/{birth_month}/{birth_year}")
-
-                except TimeoutException:
-                    logging.error("Timeout waiting for DOB fields")
-                    self._take_screenshot(driver, "timeout_dob_fields")
-                except Exception as e:
-                    logging.error(f"Error entering DOB: {e}")
-                    self._take_screenshot(driver, "error_dob_entry")
-
-                    # Debug: Print all button and input elements
-                    try:
-                        all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                        all_inputs = driver.find_elements(By.TAG_NAME, "input")
-                        all_divs = driver.find_elements(By.CSS_SELECTOR, "div[role='combobox']")
-
-                        logging.info(f"DEBUG: Found {len(all_buttons)} buttons, {len(all_inputs)} inputs, {len(all_divs)} combobox divs")
-
-                        for i, btn in enumerate(all_buttons[:5]):
-                            btn_attrs = {
-                                'text': btn.text[:30] if btn.text else 'no-text',
-                                'aria-label': btn.get_attribute("aria-label"),
-                                'class': btn.get_attribute("class")[:50] if btn.get_attribute("class") else 'no-class'
-                            }
-                            logging.info(f"  Button #{i+1}: {btn_attrs}")
-
-                        for i, inp in enumerate(all_inputs[:5]):
-                            inp_attrs = {
-                                'name': inp.get_attribute("name"),
-                                'type': inp.get_attribute("type"),
-                                'aria-label': inp.get_attribute("aria-label"),
-                                'placeholder': inp.get_attribute("placeholder")
-                            }
-                            logging.info(f"  Input #{i+1}: {inp_attrs}")
-                    except:
-                        pass
-
-                if not dob_entered:
-                    logging.error("CRITICAL: Could not enter DOB - cannot continue")
-                    self._take_screenshot(driver, "failed_dob")
-                    return None
-
-                time.sleep(0.5)  # Reduced from 1s - Give page time to be ready for Next button
-
-                # Click Next button after DOB using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after country/DOB"):
-                    logging.warning("Could not auto-click Next button - may already be on next page or needs manual click")
-                
-                time.sleep(1)  # Wait for page to navigate
-
-            except Exception as e:
-                logging.error(f"Failed at step 3 (country/DOB): {e}")
-                self._take_screenshot(driver, "error_step3")
-                # Don't return None - continue to next step
+            # STEP 3: Country and DOB (this comes before name!) - only a missing DOB is fatal
+            error = self._step_country_dob(driver, birth_year, birth_month, birth_day)
+            if error:
+                return self._failed(email, error)
 
             # STEP 4: Enter name (comes AFTER country/DOB) - OR MAYBE IT'S CAPTCHA?
-            logging.info("Step 4: Checking for name fields or CAPTCHA...")
-            time.sleep(0.5)  # Reduced from 1s
-            self._take_screenshot(driver, "step4_name_page")
-            logging.info(f"Current URL: {driver.current_url}")
-
-            try:
-                # Try to find first name with multiple selectors
-                first_name_found = False
-                first_name_selectors = [
-                    (By.CSS_SELECTOR, "input[aria-label*='First' i]"),
-                    (By.NAME, "FirstName"),
-                    (By.ID, "FirstName"),
-                    (By.CSS_SELECTOR, "input[name='FirstName']"),
-                    (By.CSS_SELECTOR, "input[type='text']:first-of-type"),
-                    (By.XPATH, "//label[contains(text(), 'First')]/following-sibling::input"),
-                    (By.XPATH, "//input[contains(@placeholder, 'First')]"),
-                    (By.XPATH, "//input[@type='text'][1]"),
-                ]
-
-                first_name_input = None
-                for selector_type, selector_value in first_name_selectors:
-                    try:
-                        first_name_input = wait_short.until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        first_name_input.clear()
-                        first_name_input.send_keys(first_name)
-                        logging.info(f"✓ Entered first name: {first_name}")
-                        first_name_found = True
-                        time.sleep(0.5)  # Let page stabilize after first name entry
-                        break
-                    except:
-                        continue
-
-                if not first_name_found:
-                    logging.info("No first name field found - might be at CAPTCHA or different page")
-                    # Check if we're at CAPTCHA page
-                    try:
-                        captcha = driver.find_element(By.ID, "enforcementFrame")
-                        logging.info("Found CAPTCHA - skipping name step")
-                    except:
-                        logging.warning("No name fields and no CAPTCHA found")
-                        self._take_screenshot(driver, "unknown_page_step4")
-                else:
-                    # Try to find and fill last name (simpler approach: get all text inputs, take 2nd one)
-                    time.sleep(0.3)  # Brief pause for page to be ready
-                    # Simple approach: Find all text inputs on page, second one should be last name
-                    last_name_found = False
-                    try:
-                        # Wait for text inputs to be present
-                        wait_short.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='text']")))
-
-                        # Get all text inputs
-                        text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
-
-                        if len(text_inputs) >= 2:
-                            # Second input should be last name
-                            last_name_input = text_inputs[1]
-                            last_name_input.clear()
-                            last_name_input.send_keys(last_name)
-                            logging.info(f"✓ Entered last name: {last_name} (using 2nd text input)")
-                            last_name_found = True
-                        else:
-                            logging.warning(f"Found only {len(text_inputs)} text input(s), expected at least 2")
-                    except Exception as e:
-                        logging.warning(f"Could not find last name field: {e}")
-
-                    if not last_name_found:
-                        logging.warning("Trying alternative last name selectors...")
-                        # Fallback selectors
-                        last_name_selectors = [
-                            (By.CSS_SELECTOR, "input[aria-label*='Last' i]"),
-                            (By.NAME, "LastName"),
-                            (By.XPATH, "//label[contains(text(), 'Last')]/following-sibling::input"),
-                        ]
-
-                        for selector_type, selector_value in last_name_selectors:
-                            try:
-                                last_name_input = driver.find_element(selector_type, selector_value)
-                                last_name_input.clear()
-                                last_name_input.send_keys(last_name)
-                                logging.info(f"✓ Entered last name: {last_name}")
-                                last_name_found = True
-                                break
-                            except:
-                                continue
-
-                    time.sleep(0.5)
-
-                    # Click Next button after name using helper method (supports Portuguese and English)
-                    if not self._click_next_button(driver, wait_time=5, context="after name"):
-                        logging.warning("Could not click Next button after name")
-                    
-                    time.sleep(1)
-
-            except Exception as e:
-                logging.warning(f"Issue at step 4 (name): {e}")
-                self._take_screenshot(driver, "error_step4")
-                # Don't return None - continue to CAPTCHA check
+            self._step_name(driver, first_name, last_name)
 
             # STEP 5: Handle CAPTCHA
-            logging.info("Step 5: Checking for CAPTCHA...")
-            time.sleep(1)  # Reduced from 1.5s
-            self._take_screenshot(driver, "step5_captcha_check")
-
-            # Check for CAPTCHA (multiple detection methods)
-            captcha_detected = False
-            try:
-                # Method 1: Look for "Let's prove you're human" text
-                page_text = driver.find_element(By.TAG_NAME, "body").text
-                if "prove you're human" in page_text.lower() or "let's prove" in page_text.lower():
-                    captcha_detected = True
-                    logging.warning("⚠ CAPTCHA detected (modern interactive CAPTCHA)!")
-
-                # Method 2: Look for enforcementFrame
-                elif driver.find_elements(By.ID, "enforcementFrame"):
-                    captcha_detected = True
-                    logging.warning("⚠ CAPTCHA detected (enforcement frame)!")
-
-                # Method 3: Check for CAPTCHA-related elements
-                elif driver.find_elements(By.CSS_SELECTOR, "[aria-label*='verification' i]") or \
-                     driver.find_elements(By.CSS_SELECTOR, "[aria-label*='captcha' i]"):
-                    captcha_detected = True
-                    logging.warning("⚠ CAPTCHA detected (verification element)!")
-
-            except:
-                pass
-
-            if captcha_detected:
-                logging.warning("=" * 60)
-                logging.warning("MANUAL CAPTCHA SOLVING REQUIRED")
-                logging.warning("Please solve the CAPTCHA in the browser window")
-                logging.warning("Waiting up to 3 minutes for you to complete it...")
-                logging.warning("=" * 60)
-
-                # Wait up to 3 minutes for CAPTCHA to be solved
-                max_wait = 180  # 3 minutes
-                start_time = time.time()
-
-                while (time.time() - start_time) < max_wait:
-                    time.sleep(2)
-
-                    # Check if we've moved past the CAPTCHA page
-                    try:
-                        current_url = driver.current_url
-                        page_text = driver.find_element(By.TAG_NAME, "body").text
-
-                        # If we're no longer on CAPTCHA page, break
-                        if "prove you're human" not in page_text.lower() and \
-                           "let's prove" not in page_text.lower():
-                            logging.info("✓ CAPTCHA appears to be solved! Continuing...")
-                            time.sleep(2)  # Give page time to fully load
-
-                            # Now click the Next button after CAPTCHA using helper method
-                            logging.info("Looking for Next button after CAPTCHA...")
-                            if self._click_next_button(driver, wait_time=5, context="after CAPTCHA"):
-                                time.sleep(3)  # Wait for navigation
-                            else:
-                                logging.warning("Could not find Next button after CAPTCHA - may auto-proceed")
-                                time.sleep(3)
-
-                            break
-                    except:
-                        pass
-                else:
-                    logging.error("CAPTCHA not solved within 3 minute timeout")
-                    self._take_screenshot(driver, "captcha_timeout")
-                    return None
-            else:
-                logging.info("No CAPTCHA detected, continuing...")
+            if not self._step_captcha(driver):
+                return self._failed(email, 'CAPTCHA not solved')
 
             # STEP 6: Verify account creation success
             logging.info("Verifying account creation...")
-            time.sleep(1)  # Reduced from 1.5s - Give page time to settle
-            self._take_screenshot(driver, "final_page")
+            self._wait_until_ready(driver)  # Give page time to settle
+            self._take_screenshot(driver, "final_page", step=True)
 
             # Check if we're at the success page or inbox
             current_url = driver.current_url
             logging.info(f"Final URL: {current_url}")
 
-            # Success indicators
-            success_indicators = [
-                "outlook.live.com",
-                "account.microsoft.com",
-                "signup.live.com/proofs",
-                "/signup?wa=wsignin"
-            ]
-
-            is_success = any(indicator in current_url for indicator in success_indicators)
+            is_success = bool(_SUCCESS_URL_RE.search(current_url))
 
             if is_success:
                 logging.info(f"✓ Account created successfully: {email}")
@@ -923,13 +575,14 @@ class OutlookAccountCreator:
                 if "signup.live.com" in current_url:
                     logging.warning("Still at signup page - check if manual steps needed")
                     logging.warning("Waiting 30 seconds for manual intervention...")
-                    time.sleep(30)
+                    # Returns on the first poll that sees a success URL
+                    self._wait_for_url(driver, _SUCCESS_URL_RE.search, timeout=30)
 
                     # Check again
                     current_url = driver.current_url
                     logging.info(f"URL after wait: {current_url}")
 
-                    if any(indicator in current_url for indicator in success_indicators):
+                    if _SUCCESS_URL_RE.search(current_url):
                         logging.info(f"✓ Account created successfully after manual intervention: {email}")
                         return {
                             'email': email,
@@ -942,13 +595,13 @@ class OutlookAccountCreator:
 
                 logging.error(f"Account creation unclear. Current URL: {current_url}")
                 self._take_screenshot(driver, "error_final")
-                return None
+                return self._failed(email, f"Account creation unclear, final URL: {current_url}")
 
         except Exception as e:
             logging.error(f"Exception creating Outlook account: {e}")
             if driver:
                 self._take_screenshot(driver, "error_exception")
-            return None
+            return self._failed(email, f"Exception: {e}")
 
         finally:
             if driver:
@@ -976,20 +629,15 @@ class OutlookAccountCreator:
 
         try:
             # Generate account details - generate name first, then use it for email (EXACT same as create_account method)
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            
-            # Generate second last name (4 letters) for email uniqueness
-            second_last_name = self.faker.last_name().lower()
-            # Take first 4 letters, or pad if shorter
-            second_last_4 = (second_last_name[:4] if len(second_last_name) >= 4 
-                            else second_last_name + 'x' * (4 - len(second_last_name)))[:4]
-            
-            # Generate username from the same name (lowercase, no spaces, with second last name)
-            first_lower = first_name.lower()
-            last_lower = last_name.lower()
-            username = f"{first_lower}{last_lower}{second_last_4}"
+            first_name = self._first_name()
+            last_name = self._last_name()
             
+            # Emails from the same name plus a 4-letter second last name (skips already-created emails)
+            emails = self._email_candidates(first_name, last_name, self.MAX_EMAIL_ATTEMPTS)
+            if not emails:
+                logging.error(f"No unused email left for {first_name} {last_name}")
+                return None
+
             password = self.generate_password()
 
             # Random birth date (age 18-50)
@@ -998,10 +646,7 @@ class OutlookAccountCreator:
             birth_day = random.randint(1, 28)
             birth_date = f"{birth_year}-{birth_month:02d}-{birth_day:02d}"
 
-            # Full email address with domain
-            email = f"{username}@outlook.com"
-
-            logging.info(f"Creating Outlook account: {email}")
+            logging.info(f"Creating Outlook account: {emails[0]}")
             logging.info(f"Name: {first_name} {last_name}")
 
             # Create browser
@@ -1011,651 +656,35 @@ class OutlookAccountCreator:
             logging.info("Loading Outlook signup page...")
             driver.get(self.SIGNUP_URL)
 
-            wait = WebDriverWait(driver, config.ELEMENT_WAIT_TIMEOUT)
-            wait_short = WebDriverWait(driver, 3)
-
-            # STEP 1: Enter email/username (SAME logic as create_account)
-            logging.info("Step 1: Entering email/username...")
-            self._take_screenshot(driver, "keepopen_step1_initial_page")
-            logging.info(f"Current URL: {driver.current_url}")
-
-            try:
-                # Try multiple selectors for username input
-                username_input = None
-                selectors = [
-                    (By.NAME, "MemberName"),
-                    (By.ID, "MemberName"),
-                    (By.CSS_SELECTOR, "input[type='email']"),
-                    (By.CSS_SELECTOR, "input[name='MemberName']"),
-                    (By.XPATH, "//input[@type='email']")
-                ]
-
-                for selector_type, selector_value in selectors:
-                    try:
-                        username_input = wait_short.until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        logging.info(f"✓ Found username input with: {selector_type} = {selector_value}")
-                        break
-                    except:
-                        continue
-
-                if not username_input:
-                    logging.error("Could not find username input field")
-                    self._take_screenshot(driver, "keepopen_error_no_username_field")
-                    return {'driver': driver, 'error': 'No username field found'}
-
-                # Try up to 3 different emails if username is taken
-                max_email_attempts = 3
-                email_accepted = False
-                
-                for attempt in range(max_email_attempts):
-                    if attempt > 0:
-                        # Generate new email for retry - keep same name, just change second last name
-                        second_last_name = self.faker.last_name().lower()
-                        second_last_4 = (second_last_name[:4] if len(second_last_name) >= 4 
-                                        else second_last_name + 'x' * (4 - len(second_last_name)))[:4]
-                        first_lower = first_name.lower()
-                        last_lower = last_name.lower()
-                        username = f"{first_lower}{last_lower}{second_last_4}"
-                        email = f"{username}@outlook.com"
-                        logging.info(f"Attempt {attempt + 1}: Trying new email: {email}")
-                    
-                    username_input.clear()
-                    username_input.send_keys(email)
-                    logging.info(f"✓ Entered email: {email}")
-                    time.sleep(1)  # Wait for validation
-
-                    # Check for "username already taken" error
-                    try:
-                        page_text = driver.find_element(By.TAG_NAME, "body").text
-                        if "already taken" in page_text.lower() or "try another" in page_text.lower():
-                            logging.warning(f"⚠ Email {email} is already taken!")
-                            self._take_screenshot(driver, f"keepopen_email_taken_attempt{attempt+1}")
-                            
-                            # Check for error message elements
-                            error_elements = driver.find_elements(By.CSS_SELECTOR, "[role='alert']")
-                            error_elements += driver.find_elements(By.CSS_SELECTOR, ".alert-error")
-                            error_elements += driver.find_elements(By.CSS_SELECTOR, "[aria-live='polite']")
-                            
-                            for elem in error_elements:
-                                if "taken" in elem.text.lower():
-                                    logging.warning(f"Error message: {elem.text}")
-                            
-                            if attempt < max_email_attempts - 1:
-                                logging.info("Will try with a different email...")
-                                continue
-                            else:
-                                logging.error(f"Failed after {max_email_attempts} email attempts")
-                                return {'driver': driver, 'error': 'All email attempts taken'}
-                        else:
-                            # No error detected - email accepted
-                            email_accepted = True
-                            break
-                    except:
-                        # If we can't check for errors, assume email is accepted
-                        email_accepted = True
-                        break
-
-                if not email_accepted:
-                    logging.error("Could not find available email username")
-                    return {'driver': driver, 'error': 'Email validation failed'}
-
-                time.sleep(0.5)
-
-                # Click Next button using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after email"):
-                    logging.error("Could not find Next button")
-                    self._take_screenshot(driver, "keepopen_error_next_button")
-                    return {'driver': driver, 'error': 'No Next button found'}
-                
-                time.sleep(1.5)  # Wait for page to load
-                
-                # After clicking Next, check again for email error (in case it appears after click)
-                time.sleep(1)
-                try:
-                    page_text = driver.find_element(By.TAG_NAME, "body").text
-                    current_url = driver.current_url
-                    
-                    # If still on email page with error, email was rejected
-                    if "signup.live.com" in current_url and "MemberName" in current_url:
-                        if "already taken" in page_text.lower():
-                            logging.error("Email was rejected after clicking Next")
-                            self._take_screenshot(driver, "keepopen_email_rejected_after_next")
-                            return {'driver': driver, 'error': 'Email rejected'}
-                except:
-                    pass
-
-            except Exception as e:
-                logging.error(f"Failed at step 1 (username): {e}")
-                self._take_screenshot(driver, "keepopen_error_step1")
-                return {'driver': driver, 'error': str(e)}
-
-            # STEP 2: Enter password (SAME logic as create_account)
-            logging.info("Step 2: Entering password...")
-            self._take_screenshot(driver, "keepopen_step2_password_page")
-
-            try:
-                password_input = None
-                password_selectors = [
-                    (By.NAME, "Password"),
-                    (By.ID, "Password"),
-                    (By.CSS_SELECTOR, "input[type='password']"),
-                    (By.CSS_SELECTOR, "input[name='Password']"),
-                    (By.XPATH, "//input[@type='password']")
-                ]
-
-                for selector_type, selector_value in password_selectors:
-                    try:
-                        password_input = wait_short.until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        logging.info(f"✓ Found password input")
-                        break
-                    except:
-                        continue
-
-                if not password_input:
-                    logging.error("Could not find password input field")
-                    self._take_screenshot(driver, "keepopen_error_no_password_field")
-                    return {'driver': driver, 'error': 'No password field found'}
-
-                password_input.clear()
-                password_input.send_keys(password)
-                logging.info(f"✓ Entered password")
-                time.sleep(0.5)  # Wait for password validation
-
-                # Click Next button using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after password"):
-                    logging.error("Could not find Next button after password")
-                    self._take_screenshot(driver, "keepopen_error_next_button_step2")
-                    return {'driver': driver, 'error': 'No Next button found after password'}
-                
-                time.sleep(1)  # Wait for next page to load
-
-            except Exception as e:
-                logging.error(f"Failed at step 2 (password): {e}")
-                self._take_screenshot(driver, "keepopen_error_step2")
-                return {'driver': driver, 'error': str(e)}
-
-            # STEP 3: Enter Country and DOB (SAME robust logic as create_account)
-            logging.info("Step 3: Entering Country and DOB...")
-            time.sleep(1)
-            self._take_screenshot(driver, "keepopen_step3_country_dob_page")
-
-            try:
-                # Try to find and select Country dropdown (optional)
-                country_found = False
-                country_selectors = [
-                    (By.ID, "Country"),
-                    (By.NAME, "Country"),
-                    (By.CSS_SELECTOR, "select[name='Country']")
-                ]
-
-                for selector_type, selector_value in country_selectors:
-                    try:
-                        country_select = Select(driver.find_element(selector_type, selector_value))
-                        country_select.select_by_value("US")
-                        logging.info("✓ Selected country: US")
-                        country_found = True
-                        break
-                    except:
-                        continue
-
-                if not country_found:
-                    logging.info("No country field found (may not be required)")
-
-                # Enter birth date - Using improved selectors based on TypeScript reference (same as create_account)
-                dob_entered = False
-
-                try:
-                    logging.info("Waiting for DOB fields to load...")
-                    time.sleep(1.5)
-
-                    # DAY - Improved selectors (Portuguese and English, with IDs)
-                    day_selectors = [
-                        (By.ID, "BirthDayDropdown"),
-                        (By.CSS_SELECTOR, "select[id='BirthDayDropdown']"),
-                        (By.CSS_SELECTOR, "combobox[id='BirthDayDropdown']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Day' i]"),
-                        (By.NAME, "BirthDay"),
-                        (By.CSS_SELECTOR, "select[name='BirthDay']"),
-                        (By.CSS_SELECTOR, "select[id='BirthDay']"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "div[aria-label*='Dia' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Day' i]"),
-                    ]
-
-                    day_element = None
-                    for selector_type, selector_value in day_selectors:
-                        try:
-                            day_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            logging.info(f"✓ Found day field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not day_element:
-                        raise Exception("Could not find Day field")
-
-                    tag_name = day_element.tag_name.lower()
-                    day_selected = False
-
-                    if tag_name == 'select':
-                        select = Select(day_element)
-                        try:
-                            select.select_by_value(str(birth_day))
-                            day_selected = True
-                            logging.info(f"✓ Selected day {birth_day} via Select")
-                        except:
-                            try:
-                                select.select_by_visible_text(str(birth_day))
-                                day_selected = True
-                                logging.info(f"✓ Selected day {birth_day} via visible text")
-                            except Exception as e:
-                                logging.error(f"Error selecting day via Select: {e}")
-                    else:
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", day_element)
-                        time.sleep(0.2)
-                        driver.execute_script("arguments[0].click();", day_element)
-                        time.sleep(0.5)
-
-                        day_value = str(birth_day)
-                        day_option_selectors = [
-                            (By.XPATH, f"//*[@role='option'][@aria-label='{day_value}']"),
-                            (By.XPATH, f"//*[@role='option'][text()='{day_value}']"),
-                            (By.XPATH, f"//option[@value='{day_value}']"),
-                            (By.XPATH, f"//li[text()='{day_value}']"),
-                            (By.XPATH, f"//div[text()='{day_value}']"),
-                            (By.XPATH, f"//*[text()='{day_value}']"),
-                        ]
-
-                        for opt_type, opt_value in day_option_selectors:
-                            try:
-                                day_option = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((opt_type, opt_value))
-                                )
-                                day_option.click()
-                                day_selected = True
-                                logging.info(f"✓ Selected day {day_value}")
-                                break
-                            except:
-                                continue
-
-                        if not day_selected:
-                            clicked = driver.execute_script("""
-                                const options = Array.from(document.querySelectorAll('[role="option"], option, li, div'));
-                                const dayOption = options.find(opt => {
-                                    const text = opt.textContent?.trim();
-                                    const ariaLabel = opt.getAttribute('aria-label');
-                                    return text === arguments[0] || ariaLabel === arguments[0];
-                                });
-                                if (dayOption) {
-                                    dayOption.click();
-                                    return true;
-                                }
-                                return false;
-                            """, day_value)
-                            if clicked:
-                                day_selected = True
-                                logging.info(f"✓ Selected day {day_value} via JavaScript")
-
-                    if not day_selected:
-                        raise Exception(f"Could not select day {birth_day}")
-
-                    time.sleep(0.3)
-
-                    # MONTH - Improved selectors with Portuguese month names
-                    month_selectors = [
-                        (By.ID, "BirthMonthDropdown"),
-                        (By.CSS_SELECTOR, "select[id='BirthMonthDropdown']"),
-                        (By.CSS_SELECTOR, "combobox[id='BirthMonthDropdown']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Month' i]"),
-                        (By.NAME, "BirthMonth"),
-                        (By.CSS_SELECTOR, "select[name='BirthMonth']"),
-                        (By.CSS_SELECTOR, "select[id='BirthMonth']"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "div[aria-label*='Mês' i]"),
-                        (By.CSS_SELECTOR, "button[aria-label*='Month' i]"),
-                    ]
-
-                    month_names_pt = ['', 'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
-                                      'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro']
-                    month_names_en = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                                     'July', 'August', 'September', 'October', 'November', 'December']
-                    
-                    month_name_pt = month_names_pt[birth_month]
-                    month_name_en = month_names_en[birth_month]
-                    month_num = str(birth_month)
-
-                    month_element = None
-                    for selector_type, selector_value in month_selectors:
-                        try:
-                            month_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            logging.info(f"✓ Found month field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not month_element:
-                        raise Exception("Could not find Month field")
-
-                    tag_name = month_element.tag_name.lower()
-                    month_selected = False
-
-                    if tag_name == 'select':
-                        select = Select(month_element)
-                        try:
-                            select.select_by_value(month_num)
-                            month_selected = True
-                            logging.info(f"✓ Selected month {month_num} via Select")
-                        except:
-                            try:
-                                select.select_by_visible_text(month_name_pt)
-                                month_selected = True
-                                logging.info(f"✓ Selected month {month_name_pt} via Select")
-                            except:
-                                try:
-                                    select.select_by_visible_text(month_name_en)
-                                    month_selected = True
-                                    logging.info(f"✓ Selected month {month_name_en} via Select")
-                                except Exception as e:
-                                    logging.error(f"Error selecting month via Select: {e}")
-                    else:
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", month_element)
-                        time.sleep(0.2)
-                        driver.execute_script("arguments[0].click();", month_element)
-                        time.sleep(0.5)
-
-                        month_option_selectors = [
-                            (By.XPATH, f"//*[@role='option'][contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//*[@role='option'][contains(text(), '{month_name_en}')]"),
-                            (By.XPATH, f"//*[@role='option'][text()='{month_num}']"),
-                            (By.XPATH, f"//*[contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//*[contains(text(), '{month_name_en}')]"),
-                            (By.XPATH, f"//li[contains(text(), '{month_name_pt}')]"),
-                            (By.XPATH, f"//div[contains(text(), '{month_name_pt}')]"),
-                        ]
-
-                        for opt_type, opt_value in month_option_selectors:
-                            try:
-                                month_option = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((opt_type, opt_value))
-                                )
-                                month_option.click()
-                                month_selected = True
-                                logging.info(f"✓ Selected month {month_name_pt}")
-                                break
-                            except:
-                                continue
-
-                        if not month_selected:
-                            clicked = driver.execute_script("""
-                                const options = Array.from(document.querySelectorAll('[role="option"], option, li, div'));
-                                const monthOption = options.find(opt => {
-                                    const text = opt.textContent?.toLowerCase().trim();
-                                    return text.includes(arguments[0].toLowerCase()) || text === arguments[1];
-                                });
-                                if (monthOption) {
-                                    monthOption.click();
-                                    return true;
-                                }
-                                return false;
-                            """, month_name_pt, month_num)
-                            if clicked:
-                                month_selected = True
-                                logging.info(f"✓ Selected month via JavaScript")
-
-                    if not month_selected:
-                        raise Exception(f"Could not select month {birth_month}")
-
-                    time.sleep(0.3)
-
-                    # YEAR - Improved selectors
-                    year_selectors = [
-                        (By.NAME, "BirthYear"),
-                        (By.ID, "BirthYear"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[type='number'][aria-label*='Year' i]"),
-                        (By.CSS_SELECTOR, "select[name='BirthYear']"),
-                        (By.CSS_SELECTOR, "select[id='BirthYear']"),
-                        (By.CSS_SELECTOR, "[role='combobox'][aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[aria-label*='Ano' i]"),
-                        (By.CSS_SELECTOR, "input[aria-label*='Year' i]"),
-                    ]
-
-                    year_element = None
-                    for selector_type, selector_value in year_selectors:
-                        try:
-                            year_element = wait_short.until(
-                                EC.presence_of_element_located((selector_type, selector_value))
-                            )
-                            logging.info(f"✓ Found year field with: {selector_type} = {selector_value}")
-                            break
-                        except:
-                            continue
-
-                    if not year_element:
-                        raise Exception("Could not find Year field")
-
-                    tag_name = year_element.tag_name.lower()
-                    year_filled = False
-
-                    if tag_name == 'select':
-                        select = Select(year_element)
-                        select.select_by_value(str(birth_year))
-                        year_filled = True
-                        logging.info(f"✓ Selected year {birth_year} via Select")
-                    else:
-                        year_element.clear()
-                        year_element.send_keys(str(birth_year))
-                        year_filled = True
-                        logging.info(f"✓ Entered year {birth_year}")
-
-                    if not year_filled:
-                        raise Exception(f"Could not fill year {birth_year}")
-
-                    dob_entered = True
-                    logging.info(f"✓ Successfully entered DOB: {birth_day}/{birth_month}/{birth_year}")
-
-                except Exception as e:
-                    logging.error(f"Error entering DOB: {e}")
-                    self._take_screenshot(driver, "keepopen_error_dob_entry")
-
-                if not dob_entered:
-                    logging.error("CRITICAL: Could not enter DOB")
-                    return {'driver': driver, 'error': 'Failed to enter DOB'}
-
-                time.sleep(1)  # Give page time to be ready for Next button
-
-                # Click Next button after DOB using helper method (supports Portuguese and English)
-                if not self._click_next_button(driver, wait_time=5, context="after DOB"):
-                    logging.warning("Could not auto-click Next button after DOB")
-                    logging.warning("Please manually click Next button...")
-                    self._take_screenshot(driver, "keepopen_manual_next_needed")
-                    # Wait up to 30 seconds for manual click
-                    logging.info("Waiting 30 seconds for manual Next click...")
-                    time.sleep(30)
-                else:
-                    time.sleep(2)  # Wait for page to navigate
-
-            except Exception as e:
-                logging.error(f"Failed at step 3 (DOB): {e}")
-                self._take_screenshot(driver, "keepopen_error_step3")
-
-            # STEP 4: Enter name (SAME logic as create_account)
-            logging.info("Step 4: Checking for name fields or CAPTCHA...")
-            time.sleep(1.5)  # Give page time to load
-            self._take_screenshot(driver, "keepopen_step4_name_page")
-            logging.info(f"Current URL: {driver.current_url}")
-
-            try:
-                # Check if we're on the name page by looking for URL pattern
-                current_url = driver.current_url
-                if "signup.live.com" in current_url and "lic=1" in current_url:
-                    logging.info("On name entry page (detected lic=1 parameter)")
-                
-                # Try to find first name - with longer wait time
-                first_name_input = None
-                first_name_selectors = [
-                    (By.CSS_SELECTOR, "input[aria-label*='First' i]"),
-                    (By.NAME, "FirstName"),
-                    (By.ID, "FirstName"),
-                    (By.CSS_SELECTOR, "input[name='FirstName']"),
-                    (By.CSS_SELECTOR, "input[type='text']:first-of-type"),
-                    (By.XPATH, "//input[@type='text'][1]"),
-                ]
-
-                for selector_type, selector_value in first_name_selectors:
-                    try:
-                        # Use longer wait for name fields
-                        first_name_input = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((selector_type, selector_value))
-                        )
-                        # Scroll into view
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", first_name_input)
-                        time.sleep(0.3)
-                        first_name_input.clear()
-                        first_name_input.send_keys(first_name)
-                        logging.info(f"✓ Entered first name: {first_name} using: {selector_type}")
-                        time.sleep(0.5)
-                        break
-                    except Exception as e:
-                        logging.debug(f"First name selector {selector_type} failed: {e}")
-                        continue
-
-                if not first_name_input:
-                    logging.warning("Could not find first name field - checking if on CAPTCHA page...")
-                    # Check if we're actually on CAPTCHA instead
-                    page_text = driver.find_element(By.TAG_NAME, "body").text
-                    if "prove you're human" in page_text.lower() or "captcha" in page_text.lower():
-                        logging.info("Actually on CAPTCHA page - skipping name step")
-                    else:
-                        logging.error("No first name field found and not on CAPTCHA page!")
-                        self._take_screenshot(driver, "keepopen_no_name_field")
-                else:
-                    # First name entered successfully - now try last name
-                    last_name_input = None
-                    time.sleep(0.5)
-                    
-                    # Method 1: Try all text inputs and pick the 2nd one
-                    text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
-                    logging.info(f"Found {len(text_inputs)} text input fields")
-                    
-                    if len(text_inputs) >= 2:
-                        last_name_input = text_inputs[1]
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", last_name_input)
-                        time.sleep(0.3)
-                        last_name_input.clear()
-                        last_name_input.send_keys(last_name)
-                        logging.info(f"✓ Entered last name: {last_name} (using 2nd text input)")
-                    else:
-                        # Method 2: Try specific selectors
-                        last_name_selectors = [
-                            (By.CSS_SELECTOR, "input[aria-label*='Last' i]"),
-                            (By.NAME, "LastName"),
-                            (By.ID, "LastName"),
-                            (By.CSS_SELECTOR, "input[name='LastName']"),
-                        ]
-                        
-                        for selector_type, selector_value in last_name_selectors:
-                            try:
-                                last_name_input = driver.find_element(selector_type, selector_value)
-                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", last_name_input)
-                                time.sleep(0.3)
-                                last_name_input.clear()
-                                last_name_input.send_keys(last_name)
-                                logging.info(f"✓ Entered last name: {last_name} using: {selector_type}")
-                                break
-                            except:
-                                continue
-                    
-                    if not last_name_input:
-                        logging.warning("Could not find last name field - may not be required")
-
-                    time.sleep(1)  # Give page time to process
-
-                    # Click Next button after name entry using helper method (supports Portuguese and English)
-                    if not self._click_next_button(driver, wait_time=5, context="after name"):
-                        logging.warning("Could not auto-click Next after name entry")
-                        logging.warning("Please manually click Next button...")
-                        self._take_screenshot(driver, "keepopen_manual_next_after_name")
-                        time.sleep(30)  # Wait for manual click
-                    else:
-                        time.sleep(2)  # Wait for navigation
-
-            except Exception as e:
-                logging.warning(f"Issue at step 4 (name): {e}")
-                self._take_screenshot(driver, "keepopen_error_step4")
-
-            # STEP 5: Handle CAPTCHA (SAME logic as create_account)
-            logging.info("Step 5: Checking for CAPTCHA...")
-            time.sleep(1.5)
-            self._take_screenshot(driver, "keepopen_step5_captcha_check")
-
-            # Check for CAPTCHA (multiple detection methods)
-            captcha_detected = False
-            try:
-                page_text = driver.find_element(By.TAG_NAME, "body").text
-                if "prove you're human" in page_text.lower() or "let's prove" in page_text.lower():
-                    captcha_detected = True
-                    logging.warning("⚠ CAPTCHA detected (modern interactive CAPTCHA)!")
-                elif driver.find_elements(By.ID, "enforcementFrame"):
-                    captcha_detected = True
-                    logging.warning("⚠ CAPTCHA detected (enforcement frame)!")
-            except:
-                pass
-
-            if captcha_detected:
-                logging.warning("=" * 60)
-                logging.warning("MANUAL CAPTCHA SOLVING REQUIRED")
-                logging.warning("Please solve the CAPTCHA in the browser window")
-                logging.warning("Waiting up to 3 minutes for you to complete it...")
-                logging.warning("=" * 60)
-
-                # Wait up to 3 minutes for CAPTCHA to be solved
-                max_wait = 180
-                start_time = time.time()
-
-                while (time.time() - start_time) < max_wait:
-                    time.sleep(2)
-                    try:
-                        current_url = driver.current_url
-                        page_text = driver.find_element(By.TAG_NAME, "body").text
-
-                        if "prove you're human" not in page_text.lower() and \
-                           "let's prove" not in page_text.lower():
-                            logging.info("✓ CAPTCHA appears to be solved! Continuing...")
-                            time.sleep(2)
-                            break
-                    except:
-                        pass
-                else:
-                    logging.error("CAPTCHA not solved within 3 minute timeout")
-                    self._take_screenshot(driver, "keepopen_captcha_timeout")
-                    return {
-                        'driver': driver,
-                        'email': email,
-                        'password': password,
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'birth_date': birth_date,
-                        'error': 'CAPTCHA timeout'
-                    }
-            else:
-                logging.info("No CAPTCHA detected, continuing...")
+            # STEPS 1-4: SAME shared steps as create_account, but waiting for manual Next clicks
+            email, error = self._step_email(driver, emails, shot_prefix="keepopen_")
+            if not error:
+                error = self._step_password(driver, password, shot_prefix="keepopen_")
+            if not error:
+                error = self._step_country_dob(driver, birth_year, birth_month, birth_day,
+                                               shot_prefix="keepopen_", manual_wait=30)
+            if error:
+                return {'driver': driver, 'error': error}
+
+            self._step_name(driver, first_name, last_name, shot_prefix="keepopen_",
+                            first_name_timeout=10, manual_wait=30)
+
+            # STEP 5: Handle CAPTCHA (the caller drives the page afterwards, so no auto Next click)
+            if not self._step_captcha(driver, shot_prefix="keepopen_", click_next=False):
+                return {
+                    'driver': driver,
+                    'email': email,
+                    'password': password,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'birth_date': birth_date,
+                    'error': 'CAPTCHA timeout'
+                }
 
             # STEP 6: Verify account creation success
             logging.info("Verifying account creation...")
-            time.sleep(2)  # Give page time to settle
-            self._take_screenshot(driver, "keepopen_final_page")
+            self._wait_until_ready(driver)  # Give page time to settle
+            self._take_screenshot(driver, "keepopen_final_page", step=True)
 
             current_url = driver.current_url
             logging.info(f"Final URL: {current_url}")
@@ -1671,19 +700,10 @@ class OutlookAccountCreator:
                 logging.error("Waiting 60 seconds for manual completion...")
                 logging.error("="*60)
                 
-                # Wait for manual completion
-                for i in range(12):  # 12 x 5 seconds = 60 seconds
-                    time.sleep(5)
-                    current_url = driver.current_url
-                    
-                    # Check if we moved past the name page
-                    if "lic=1" not in current_url:
-                        logging.info(f"✓ Moved past name page! New URL: {current_url}")
-                        break
-                    
-                    if i % 3 == 0:
-                        logging.info(f"Still waiting for name page completion... ({(i+1)*5}s elapsed)")
-                
+                # Wait for manual completion (returns as soon as we move past the name page)
+                if self._wait_for_url(driver, lambda url: "lic=1" not in url, timeout=60):
+                    logging.info(f"✓ Moved past name page! New URL: {driver.current_url}")
+
                 # Update current URL after waiting
                 current_url = driver.current_url
                 logging.info(f"URL after manual intervention: {current_url}")
@@ -1692,29 +712,19 @@ class OutlookAccountCreator:
             try:
                 page_title = driver.title
                 logging.info(f"Page title: {page_title}")
-            except:
+            except WebDriverException:
                 page_title = "Unknown"
 
-            # Success indicators - expanded list
-            success_indicators = [
-                "outlook.live.com",
-                "outlook.office.com", 
-                "account.microsoft.com",
-                "signup.live.com/proofs",  # Proofs page (phone verification step - still success)
-                "/signup?wa=wsignin",
-                "login.live.com/login",  # Sometimes redirects here after success
-            ]
-
-            # Check current state
-            is_success = any(indicator in current_url for indicator in success_indicators)
+            # Check current state against the expanded success list
+            is_success = bool(_KEEPOPEN_SUCCESS_URL_RE.search(current_url))
             
             # Also check if page text indicates success
             try:
-                page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-                if any(phrase in page_text for phrase in ["welcome", "you're all set", "inbox", "get started"]):
+                page_text = self._page_text(driver)
+                if _SUCCESS_RE.search(page_text):
                     is_success = True
                     logging.info("✓ Success detected from page content")
-            except:
+            except WebDriverException:
                 pass
 
             if is_success:
@@ -1739,29 +749,23 @@ class OutlookAccountCreator:
                 logging.warning("Please complete any remaining steps manually")
                 logging.warning("="*60)
                 
-                # Wait and check periodically
-                for i in range(12):  # 12 x 5 seconds = 60 seconds
-                    time.sleep(5)
+                # Wait for the URL to change to a success page
+                if self._wait_for_url(driver, _KEEPOPEN_SUCCESS_URL_RE.search, timeout=60):
                     current_url = driver.current_url
-                    
-                    # Check if URL changed to success page
-                    if any(indicator in current_url for indicator in success_indicators):
-                        logging.info(f"✓ Account created successfully after manual intervention: {email}")
-                        logging.info(f"Final URL: {current_url}")
-                        return {
-                            'driver': driver,
-                            'email': email,
-                            'password': password,
-                            'first_name': first_name,
-                            'last_name': last_name,
-                            'birth_date': birth_date,
-                            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                    
-                    if i % 3 == 0:  # Log every 15 seconds
-                        logging.info(f"Still waiting... ({(i+1)*5}s elapsed)")
+                    logging.info(f"✓ Account created successfully after manual intervention: {email}")
+                    logging.info(f"Final URL: {current_url}")
+                    return {
+                        'driver': driver,
+                        'email': email,
+                        'password': password,
+                        'first_name': first_name,
+                        'last_name': last_name,
+                        'birth_date': birth_date,
+                        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    }
 
                 # After 60 seconds, return what we have
+                current_url = driver.current_url
                 logging.warning(f"Manual intervention timeout. Final URL: {current_url}")
                 self._take_screenshot(driver, "keepopen_manual_timeout")
                 
@@ -1811,6 +815,522 @@ class OutlookAccountCreator:
         # NOTE: No finally block that closes driver!
         # Caller is responsible for closing the driver when done
 
+    # --- Signup steps shared by create_account and create_account_keep_open ---
+    # Fatal steps return an error string (None on success); shot_prefix namespaces their screenshots.
+
+    def _step_email(self, driver, emails: List[str], shot_prefix: str = "") -> Tuple[Optional[str], Optional[str]]:
+        """STEP 1: Enter the first available email, retrying the next candidate when taken. Returns (email, error)"""
+        logging.info("Step 1: Entering email/username...")
+        self._take_screenshot(driver, f"{shot_prefix}step1_initial_page", step=True)
+        logging.info(f"Current URL: {driver.current_url}")
+
+        # Shorter wait for form validation, polled at 100 ms like the other step waits (default is 500 ms)
+        wait_short = WebDriverWait(driver, 3, poll_frequency=0.1)
+        email = None
+        try:
+            # Try multiple selectors for username input. driver.get() returns at DOMContentLoaded (eager
+            # page load), so the first field gets the full element timeout for the form to render
+            username_input, found = self._find_any(driver, self._USERNAME_SELECTORS, timeout=config.ELEMENT_WAIT_TIMEOUT)
+            if username_input:
+                logging.info(f"✓ Found username input with: {found[0]} = {found[1]}")
+
+            if not username_input:
+                logging.error("Could not find username input field with any selector")
+                self._take_screenshot(driver, f"{shot_prefix}error_no_username_field")
+                return None, 'No username field found'
+
+            # Try up to MAX_EMAIL_ATTEMPTS different emails if username is taken
+            max_email_attempts = len(emails)
+            email_accepted = False
+            
+            for attempt, email in enumerate(emails):
+                if attempt > 0:
+                    # Next pre-drawn email - same name, different second last name
+                    logging.info(f"Attempt {attempt + 1}: Trying new email: {email}")
+                
+                self._fill(driver, username_input, email)
+                logging.info(f"✓ Entered email: {email}")
+                # Returns as soon as the form validated (taken error shown or Next enabled)
+                try:
+                    wait_short.until(self._email_check_settled)
+                except (TimeoutException, StaleElementReferenceException):
+                    pass
+
+                # Check for "username already taken" error
+                try:
+                    error_text = self._email_error(driver)
+                    if error_text:
+                        if _TAKEN_RE.search(error_text):
+                            logging.warning(f"⚠ Email {email} is already taken!")
+                        else:
+                            logging.warning(f"⚠ Email {email} was rejected: {error_text}")
+                        self._take_screenshot(driver, f"{shot_prefix}email_taken_attempt{attempt+1}")
+                        
+                        if attempt < max_email_attempts - 1:
+                            logging.info("Will try with a different email...")
+                            continue
+                        else:
+                            logging.error(f"Failed after {max_email_attempts} email attempts")
+                            return None, 'All email attempts taken'
+                    else:
+                        # No error detected - email accepted
+                        email_accepted = True
+                        break
+                except WebDriverException:
+                    # If we can't check for errors, assume email is accepted
+                    email_accepted = True
+                    break
+
+            if not email_accepted:
+                logging.error("Could not find available email username")
+                return None, 'Email validation failed'
+
+            # Click Next button using helper method (supports Portuguese and English)
+            step_url = driver.current_url  # Before the click, so an instant navigation still counts
+            if not self._click_next_button(driver, wait_time=5, context="after email"):
+                logging.error("Could not find Next button with any selector")
+                self._take_screenshot(driver, f"{shot_prefix}error_next_button")
+                return None, 'No Next button found'
+            
+            # Wait for the email step to be replaced (or the URL to change) instead of a fixed sleep
+            self._wait_for_step_change(driver, username_input, start_url=step_url)
+
+            # After clicking Next, check again for email error (in case it appears after click)
+            try:
+                current_url = driver.current_url
+                
+                # If still on email page with error, email was rejected
+                if "signup.live.com" in current_url and "MemberName" in current_url:
+                    if self._email_error(driver):
+                        logging.error("Email was rejected after clicking Next")
+                        self._take_screenshot(driver, f"{shot_prefix}email_rejected_after_next")
+                        return None, 'Email rejected'
+            except WebDriverException:
+                pass
+
+            return email, None
+
+        except Exception as e:
+            logging.error(f"Failed at step 1 (username): {e}")
+            self._take_screenshot(driver, f"{shot_prefix}error_step1")
+            try:
+                # Only the length crosses the wire, not the whole serialized document
+                source_length = driver.execute_script("return document.documentElement.outerHTML.length")
+                logging.error(f"Page source length: {source_length}")
+            except Exception:
+                pass
+            return None, str(e)
+
+    def _step_password(self, driver, password: str, shot_prefix: str = "") -> Optional[str]:
+        """STEP 2: Enter the password and move on. Returns an error string on failure"""
+        logging.info("Step 2: Entering password...")
+        self._take_screenshot(driver, f"{shot_prefix}step2_password_page", step=True)
+
+        try:
+            # Try multiple selectors for password input
+            password_input, found = self._find_any(driver, self._PASSWORD_SELECTORS)
+            if password_input:
+                logging.info(f"✓ Found password input with: {found[0]} = {found[1]}")
+
+            if not password_input:
+                logging.error("Could not find password input field with any selector")
+                self._take_screenshot(driver, f"{shot_prefix}error_no_password_field")
+                return 'No password field found'
+
+            self._fill(driver, password_input, password)
+            logging.info(f"✓ Entered password")
+
+            # Click Next button using helper method (supports Portuguese and English)
+            step_url = driver.current_url  # Before the click, so an instant navigation still counts
+            if not self._click_next_button(driver, wait_time=5, context="after password"):
+                logging.error("Could not find Next button after password")
+                self._take_screenshot(driver, f"{shot_prefix}error_next_button_step2")
+                return 'No Next button found after password'
+            
+            self._wait_for_step_change(driver, password_input, start_url=step_url)
+            return None
+
+        except Exception as e:
+            logging.error(f"Failed at step 2 (password): {e}")
+            self._take_screenshot(driver, f"{shot_prefix}error_step2")
+            return str(e)
+
+    def _step_country_dob(self, driver, birth_year: int, birth_month: int, birth_day: int,
+                          shot_prefix: str = "", manual_wait: float = 0) -> Optional[str]:
+        """
+        STEP 3: Select country (optional) and enter the birth date, then click Next
+
+        Returns an error string only when the DOB could not be entered; other
+        issues are logged and the flow continues. With manual_wait > 0, a Next
+        button that can't be clicked waits that long for a manual click.
+        """
+        logging.info("Step 3: Entering Country and DOB...")
+        self._wait_until_ready(driver)
+        self._take_screenshot(driver, f"{shot_prefix}step3_country_dob_page", step=True)
+
+        try:
+            logging.info(f"Current URL: {driver.current_url}")
+            logging.info(f"Page title: {driver.title}")
+
+            # Print visible text on page (first 500 chars) for debugging - DEBUG level only, it costs a round-trip
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                try:
+                    logging.debug("Page text preview: %s", self._page_text(driver, 500))
+                except WebDriverException:
+                    pass
+
+            # Try to find and select Country dropdown (optional)
+            country_found = False
+
+            # Single probe of every selector (timeout=0: the field is optional, don't wait for it)
+            country_element, _ = self._find_any(driver, self._COUNTRY_SELECTORS, timeout=0)
+            if country_element:
+                try:
+                    Select(country_element).select_by_value("US")
+                    logging.info("✓ Selected country: US")
+                    country_found = True
+                except Exception as e:
+                    logging.debug("Could not select country: %s", e)
+
+            if not country_found:
+                logging.info("No country field found (may not be required)")
+
+            # Enter birth date - Using improved selectors based on TypeScript reference
+            dob_entered = False
+            day_element = None
+
+            try:
+                logging.info("Waiting for DOB fields to load...")
+                day_element = self._enter_dob(driver, birth_year, birth_month, birth_day, shot_prefix)
+                dob_entered = True
+                logging.info(f"✓ Successfully entered complete DOB: {birth_day}/{birth_month}/{birth_year}")
+
+            except TimeoutException:
+                logging.error("Timeout waiting for DOB fields")
+                self._take_screenshot(driver, f"{shot_prefix}timeout_dob_fields")
+            except Exception as e:
+                logging.error(f"Error entering DOB: {e}")
+                self._take_screenshot(driver, f"{shot_prefix}error_dob_entry")
+                self._log_form_summary(driver)
+
+            if not dob_entered:
+                logging.error("CRITICAL: Could not enter DOB - cannot continue")
+                self._take_screenshot(driver, f"{shot_prefix}failed_dob")
+                return 'Failed to enter DOB'
+
+            # Click Next button after DOB using helper method (supports Portuguese and English)
+            step_url = driver.current_url  # Before the click, so an instant navigation still counts
+            if self._click_next_button(driver, wait_time=5, context="after country/DOB"):
+                self._wait_for_step_change(driver, day_element, start_url=step_url)
+            elif manual_wait:
+                logging.warning("Could not auto-click Next button after DOB")
+                logging.warning("Please manually click Next button...")
+                self._take_screenshot(driver, f"{shot_prefix}manual_next_needed", step=True)
+                # Returns as soon as the page moves on
+                logging.info(f"Waiting {manual_wait:g} seconds for manual Next click...")
+                self._wait_for_step_change(driver, day_element, timeout=manual_wait, start_url=step_url)
+            else:
+                logging.warning("Could not auto-click Next button - may already be on next page or needs manual click")
+                self._wait_for_step_change(driver, day_element, start_url=step_url)
+
+        except Exception as e:
+            logging.error(f"Failed at step 3 (country/DOB): {e}")
+            self._take_screenshot(driver, f"{shot_prefix}error_step3")
+            # Not fatal - continue to next step
+        return None
+
+    def _enter_dob(self, driver, birth_year: int, birth_month: int, birth_day: int, shot_prefix: str = ""):
+        """Fill the day, month and year fields (select or custom combobox); returns the day element, raises on failure"""
+        # DAY - Improved selectors (Portuguese and English, with IDs)
+        day_element, found = self._find_any(driver, self._DAY_SELECTORS)
+        if day_element:
+            logging.info(f"✓ Found day field with: {found[0]} = {found[1]}")
+
+        if not day_element:
+            logging.error("Could not find day field with any selector")
+            self._take_screenshot(driver, f"{shot_prefix}error_day_field_not_found")
+            raise Exception("Could not find Day field")
+
+        # Check if it's a select or combobox
+        tag_name = day_element.tag_name.lower()
+        day_selected = False
+
+        if tag_name == 'select':
+            # HTML select - use Select class
+            logging.info("Day field is HTML select, using Select class")
+            select = Select(day_element)
+            try:
+                select.select_by_value(str(birth_day))
+                day_selected = True
+                logging.info(f"✓ Selected day {birth_day} via Select")
+            except NoSuchElementException:
+                try:
+                    select.select_by_visible_text(str(birth_day))
+                    day_selected = True
+                    logging.info(f"✓ Selected day {birth_day} via visible text")
+                except Exception as e:
+                    logging.error(f"Error selecting day via Select: {e}")
+        else:
+            # Custom combobox - open it and click the option in one async script round-trip
+            logging.info("Day field is custom combobox, clicking and selecting option")
+            day_value = str(birth_day)
+            if self._pick_option(driver, day_element, exact=[day_value]):
+                day_selected = True
+                logging.info(f"✓ Selected day {day_value}")
+
+        if not day_selected:
+            raise Exception(f"Could not select day {birth_day}")
+
+        self._wait_for_listbox_closed(driver)
+
+        # MONTH - Improved selectors with Portuguese month names
+        month_name_pt = self._MONTH_NAMES_PT[birth_month - 1]
+        month_name_en = self._MONTH_NAMES_EN[birth_month - 1]
+        month_num = str(birth_month)
+
+        month_element, found = self._find_any(driver, self._MONTH_SELECTORS)
+        if month_element:
+            logging.info(f"✓ Found month field with: {found[0]} = {found[1]}")
+
+        if not month_element:
+            raise Exception("Could not find Month field")
+
+        tag_name = month_element.tag_name.lower()
+        month_selected = False
+
+        if tag_name == 'select':
+            # HTML select
+            logging.info("Month field is HTML select")
+            select = Select(month_element)
+            try:
+                select.select_by_value(month_num)
+                month_selected = True
+                logging.info(f"✓ Selected month {month_num} via Select")
+            except NoSuchElementException:
+                try:
+                    select.select_by_visible_text(month_name_pt)
+                    month_selected = True
+                    logging.info(f"✓ Selected month {month_name_pt} via Select")
+                except NoSuchElementException:
+                    try:
+                        select.select_by_visible_text(month_name_en)
+                        month_selected = True
+                        logging.info(f"✓ Selected month {month_name_en} via Select")
+                    except Exception as e:
+                        logging.error(f"Error selecting month via Select: {e}")
+        else:
+            # Custom combobox - Portuguese first, then English, then number - one async script round-trip
+            logging.info("Month field is custom combobox")
+            if self._pick_option(driver, month_element, contains=[month_name_pt, month_name_en], exact=[month_num]):
+                month_selected = True
+                logging.info(f"✓ Selected month {month_name_pt}")
+
+        if not month_selected:
+            raise Exception(f"Could not select month {birth_month}")
+
+        self._wait_for_listbox_closed(driver)
+
+        # YEAR - Improved selectors
+        year_element, found = self._find_any(driver, self._YEAR_SELECTORS)
+        if year_element:
+            logging.info(f"✓ Found year field with: {found[0]} = {found[1]}")
+
+        if not year_element:
+            raise Exception("Could not find Year field")
+
+        if year_element.tag_name.lower() == 'select':
+            # HTML select
+            Select(year_element).select_by_value(str(birth_year))
+            logging.info(f"✓ Selected year {birth_year} via Select")
+        else:
+            # Input field
+            self._fill(driver, year_element, str(birth_year))
+            logging.info(f"✓ Entered year {birth_year}")
+
+        return day_element
+
+    def _log_form_summary(self, driver):
+        """Debug: Print all button and input elements (one script round-trip, DEBUG level only)"""
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        try:
+            summary = driver.execute_script(self._DEBUG_FORM_JS)
+
+            logging.debug(f"Found {summary['buttons']} buttons, {summary['inputs']} inputs, {summary['comboboxes']} combobox divs")
+
+            for i, btn_attrs in enumerate(summary['button_details']):
+                logging.debug(f"  Button #{i+1}: {btn_attrs}")
+
+            for i, inp_attrs in enumerate(summary['input_details']):
+                logging.debug(f"  Input #{i+1}: {inp_attrs}")
+        except Exception:
+            pass
+
+    def _step_name(self, driver, first_name: str, last_name: str, shot_prefix: str = "",
+                   first_name_timeout: float = 3, manual_wait: float = 0):
+        """STEP 4: Enter first/last name and click Next - skipped when the page is a CAPTCHA instead (never fatal)"""
+        logging.info("Step 4: Checking for name fields or CAPTCHA...")
+        self._wait_until_ready(driver)
+        self._take_screenshot(driver, f"{shot_prefix}step4_name_page", step=True)
+        current_url = driver.current_url
+        logging.info(f"Current URL: {current_url}")
+
+        try:
+            # Check if we're on the name page by looking for URL pattern
+            if "signup.live.com" in current_url and "lic=1" in current_url:
+                logging.info("On name entry page (detected lic=1 parameter)")
+
+            # Try to find first name with multiple selectors
+            first_name_input, found = self._find_any(driver, self._FIRST_NAME_SELECTORS, timeout=first_name_timeout)
+            if first_name_input:
+                try:
+                    # _fill focuses the field, which scrolls it into view
+                    self._fill(driver, first_name_input, first_name)
+                    logging.info(f"✓ Entered first name: {first_name} using: {found[0]}")
+                except Exception as e:
+                    logging.warning(f"Could not enter first name with {found[0]} = {found[1]}: {e}")
+                    first_name_input = None
+
+            if not first_name_input:
+                logging.info("No first name field found - might be at CAPTCHA or different page")
+                # Check if we're at CAPTCHA page
+                captcha_state = self._captcha_state(driver)
+                if captcha_state['frame'] or captcha_state['human']:
+                    logging.info("Found CAPTCHA - skipping name step")
+                else:
+                    logging.warning("No name fields and no CAPTCHA found")
+                    self._take_screenshot(driver, f"{shot_prefix}unknown_page_step4")
+                return
+
+            # Try to find and fill last name (simple approach: get all text inputs, take 2nd one)
+            last_name_found = False
+            try:
+                # Wait for text inputs to be present
+                text_inputs = WebDriverWait(driver, 3, poll_frequency=0.1).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='text']"))
+                )
+
+                if len(text_inputs) >= 2:
+                    # Second input should be last name
+                    self._fill(driver, text_inputs[1], last_name)
+                    logging.info(f"✓ Entered last name: {last_name} (using 2nd text input)")
+                    last_name_found = True
+                else:
+                    logging.warning(f"Found only {len(text_inputs)} text input(s), expected at least 2")
+            except Exception as e:
+                logging.warning(f"Could not find last name field: {e}")
+
+            if not last_name_found:
+                logging.warning("Trying alternative last name selectors...")
+                last_name_input, found = self._find_any(driver, self._LAST_NAME_SELECTORS, timeout=0)
+                if last_name_input:
+                    try:
+                        self._fill(driver, last_name_input, last_name)
+                        logging.info(f"✓ Entered last name: {last_name} using: {found[0]}")
+                        last_name_found = True
+                    except Exception as e:
+                        logging.warning(f"Could not fill last name field: {e}")
+
+            if not last_name_found:
+                logging.warning("Could not find last name field - may not be required")
+
+            # Click Next button after name using helper method (supports Portuguese and English)
+            step_url = driver.current_url  # Before the click, so an instant navigation still counts
+            if self._click_next_button(driver, wait_time=5, context="after name"):
+                self._wait_for_step_change(driver, first_name_input, start_url=step_url)
+            elif manual_wait:
+                logging.warning("Could not auto-click Next after name entry")
+                logging.warning("Please manually click Next button...")
+                self._take_screenshot(driver, f"{shot_prefix}manual_next_after_name", step=True)
+                self._wait_for_step_change(driver, first_name_input, timeout=manual_wait, start_url=step_url)
+            else:
+                logging.warning("Could not click Next button after name")
+                self._wait_for_step_change(driver, first_name_input, start_url=step_url)
+
+        except Exception as e:
+            logging.warning(f"Issue at step 4 (name): {e}")
+            self._take_screenshot(driver, f"{shot_prefix}error_step4")
+            # Not fatal - continue to CAPTCHA check
+
+    def _step_captcha(self, driver, shot_prefix: str = "", click_next: bool = True, max_wait: float = 180) -> bool:
+        """
+        STEP 5: Detect a CAPTCHA and wait up to `max_wait` seconds for it to be solved manually
+
+        Returns False only when a CAPTCHA was shown and not solved in time.
+        With click_next, clicks the Next button the page shows after the CAPTCHA.
+        """
+        logging.info("Step 5: Checking for CAPTCHA...")
+        self._wait_until_ready(driver)
+        self._take_screenshot(driver, f"{shot_prefix}step5_captcha_check", step=True)
+
+        # Check for CAPTCHA (multiple detection methods)
+        captcha_detected = False
+        try:
+            # All three detection methods evaluated in one script round-trip
+            captcha_state = self._captcha_state(driver)
+
+            # Method 1: Look for "Let's prove you're human" text
+            if captcha_state['human']:
+                captcha_detected = True
+                logging.warning("⚠ CAPTCHA detected (modern interactive CAPTCHA)!")
+
+            # Method 2: Look for enforcementFrame
+            elif captcha_state['frame']:
+                captcha_detected = True
+                logging.warning("⚠ CAPTCHA detected (enforcement frame)!")
+
+            # Method 3: Check for CAPTCHA-related elements
+            elif captcha_state['verification']:
+                captcha_detected = True
+                logging.warning("⚠ CAPTCHA detected (verification element)!")
+
+        except Exception:
+            pass
+
+        if not captcha_detected:
+            logging.info("No CAPTCHA detected, continuing...")
+            return True
+
+        logging.warning("=" * 60)
+        logging.warning("MANUAL CAPTCHA SOLVING REQUIRED")
+        logging.warning("Please solve the CAPTCHA in the browser window")
+        logging.warning(f"Waiting up to {max_wait / 60:g} minutes for you to complete it...")
+        logging.warning("=" * 60)
+
+        start_time = time.time()
+        captcha_url = driver.current_url
+        polls = 0
+
+        while (time.time() - start_time) < max_wait:
+            time.sleep(0.5)
+            polls += 1
+
+            # Check if we've moved past the CAPTCHA page (URL every poll, page text every 2 s)
+            try:
+                if not self._captcha_cleared(driver, captcha_url, check_text=polls % 4 == 0):
+                    continue
+            except WebDriverException:
+                continue
+
+            logging.info("✓ CAPTCHA appears to be solved! Continuing...")
+            self._wait_until_ready(driver)
+
+            if click_next:
+                # Now click the Next button after CAPTCHA using helper method
+                logging.info("Looking for Next button after CAPTCHA...")
+                step_url = driver.current_url  # Before the click, so an instant navigation still counts
+                next_button = self._click_next_button(driver, wait_time=5, context="after CAPTCHA")
+                if next_button:
+                    self._wait_for_step_change(driver, next_button, timeout=3, start_url=step_url)  # Wait for navigation
+                else:
+                    logging.warning("Could not find Next button after CAPTCHA - may auto-proceed")
+                    self._wait_for_step_change(driver, None, timeout=3, start_url=step_url)
+            return True
+
+        logging.error(f"CAPTCHA not solved within {max_wait / 60:g} minute timeout")
+        self._take_screenshot(driver, f"{shot_prefix}captcha_timeout")
+        return False
+
     def _click_next_button(self, driver, wait_time: int = 5, context: str = ""):
         """
         Helper method to click Next/Avançar button supporting both Portuguese and English
@@ -1821,77 +1341,202 @@ class OutlookAccountCreator:
             context: Context description for logging (e.g., "after password")
         
         Returns:
-            True if button was clicked successfully, False otherwise
+            The clicked button element (truthy) if clicked successfully, False otherwise
         """
-        next_button = None
-        wait = WebDriverWait(driver, wait_time)
-        
         # Try multiple selectors including both English and Portuguese
-        next_selectors = [
-            (By.ID, "iSignupAction"),
-            (By.CSS_SELECTOR, "button[type='submit']"),
-            (By.CSS_SELECTOR, "input[type='submit']"),
-            (By.XPATH, "//button[contains(text(), 'Next')]"),  # English
-            (By.XPATH, "//button[contains(text(), 'Avançar')]"),  # Portuguese
-            (By.XPATH, "//button[contains(@class, 'fui-Button') and contains(text(), 'Avançar')]"),  # Portuguese with class
-            (By.XPATH, "//button[contains(@class, 'fui-Button') and contains(text(), 'Next')]"),  # English with class
-            (By.CSS_SELECTOR, "button.fui-Button"),  # Any button with fui-Button class
-            (By.XPATH, "//input[@type='submit']"),
-            (By.XPATH, "//input[@value='Next']"),
-            (By.XPATH, "//input[@value='Avançar']"),
-        ]
-        
-        for selector_type, selector_value in next_selectors:
-            try:
-                next_button = wait.until(
-                    EC.element_to_be_clickable((selector_type, selector_value))
-                )
-                # Scroll into view
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.2)
-                
-                # Try normal click first
-                try:
-                    next_button.click()
-                    logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} using: {selector_type} = {selector_value}")
-                    return True
-                except:
-                    # Fallback to JavaScript click
-                    driver.execute_script("arguments[0].click();", next_button)
-                    logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} (JS click) using: {selector_type} = {selector_value}")
-                    return True
-            except Exception as e:
-                logging.debug(f"Selector {selector_type} = {selector_value} failed: {e}")
-                continue
-        
-        # Fallback: Search all buttons for text
-        if not next_button:
-            try:
-                all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                for btn in all_buttons:
-                    try:
-                        btn_text = btn.text.strip()
-                        if btn_text in ["Next", "Avançar"] or "Avançar" in btn_text or "Next" in btn_text:
-                            if btn.is_displayed() and btn.is_enabled():
-                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                                time.sleep(0.2)
-                                driver.execute_script("arguments[0].click();", btn)
-                                logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} using fallback (text: {btn_text})")
-                                return True
-                    except:
-                        continue
-            except Exception as e:
-                logging.debug(f"Fallback button search failed: {e}")
-        
+        next_button, found = self._find_any(driver, self._NEXT_SELECTORS, timeout=wait_time, clickable=True)
+        if next_button and self._click_found_button(driver, next_button, found, context):
+            return next_button
+
+        # Fallback: Search all buttons for text (one script instead of .text/.is_displayed() per button)
+        try:
+            hit = driver.execute_script(self._CLICK_NEXT_TEXT_JS)
+            if hit:
+                btn, btn_text = hit
+                logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} using fallback (text: {btn_text})")
+                return btn
+        except Exception as e:
+            logging.debug("Fallback button search failed: %s", e)
+
+        # Last resort: generic Fluent UI button, a single probe once the specific selectors' budget is spent
+        next_button, found = self._find_any(driver, self._NEXT_FALLBACK_SELECTORS, timeout=0, clickable=True)
+        if next_button and self._click_found_button(driver, next_button, found, context):
+            return next_button
+
         return False
 
-    def _take_screenshot(self, driver, name: str):
-        """Take screenshot for debugging"""
+    def _click_found_button(self, driver, button, found, context: str = "") -> bool:
+        """Scroll to and click a located Next button, falling back to a JS click; False if both fail"""
+        selector_type, selector_value = found
+        try:
+            # Scroll into view (scrollIntoView is synchronous - no need to wait after it)
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+
+            # Try normal click first
+            try:
+                button.click()
+                logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} using: {selector_type} = {selector_value}")
+            except WebDriverException:
+                # Fallback to JavaScript click
+                driver.execute_script("arguments[0].click();", button)
+                logging.info(f"✓ Clicked Next button{(' ' + context) if context else ''} (JS click) using: {selector_type} = {selector_value}")
+            return True
+        except Exception as e:
+            logging.debug("Selector %s = %s failed: %s", selector_type, selector_value, e)
+            return False
+
+    def _find_any(self, driver, selectors, timeout: float = 3, initial_interval: float = 0.1,
+                  clickable: bool = False):
+        """
+        Poll every (by, value) selector each tick and return the first hit
+
+        All selectors share one deadline with exponential backoff between ticks
+        (capped at 1 s), so a miss costs `timeout` in total instead of `timeout`
+        per selector. Earlier selectors win when several match in the same tick.
+
+        Returns:
+            (element, (by, value)) for the first match, or (None, None) on timeout
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial_interval
+        script_selectors = [list(selector) for selector in selectors]
+        while True:
+            # One execute_script per tick checks every selector (instead of one find_elements each)
+            hit = driver.execute_script(self._FIND_ANY_JS, script_selectors, clickable)
+            if hit:
+                index, element = hit
+                return element, selectors[index]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, None
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, 1.0)
+
+    def _fill(self, driver, element, text: str):
+        """Replace an input's value, inserting the text with one CDP call instead of a key event per character"""
+        try:
+            # Focus and emptiness check in one call - fresh fields skip the clear() round-trip
+            if driver.execute_script("arguments[0].focus(); return !!arguments[0].value;", element):
+                element.clear()  # WebDriver clear blurs the field, so focus it again
+                driver.execute_script("arguments[0].focus();", element)
+            driver.execute_cdp_cmd('Input.insertText', {'text': text})
+        except Exception as e:
+            logging.debug("Input.insertText failed, falling back to send_keys: %s", e)
+            element.clear()
+            element.send_keys(text)
+
+    def _pick_option(self, driver, element, exact=(), contains=(), timeout: float = 3) -> bool:
+        """
+        Open a custom combobox and click the first option matching a label
+
+        `exact` labels must equal the option text or aria-label, `contains`
+        labels match case-insensitively anywhere in the text. Opening, waiting
+        for the listbox and clicking happen in one execute_async_script call.
+        """
+        try:
+            return bool(driver.execute_async_script(
+                self._PICK_OPTION_JS, element, list(exact), list(contains), int(timeout * 1000)
+            ))
+        except Exception as e:
+            logging.debug("Combobox option pick failed: %s", e)
+            return False
+
+    def _wait_for_url(self, driver, predicate, timeout: float = 60) -> bool:
+        """Poll current_url every 0.5 s until predicate(url) holds; False on timeout"""
         try:
-            import os
-            os.makedirs("screenshots", exist_ok=True)
-            filename = f"screenshots/{name}_{int(time.time())}.png"
-            driver.save_screenshot(filename)
+            WebDriverWait(driver, timeout, poll_frequency=0.5).until(lambda d: predicate(d.current_url))
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_for_step_change(self, driver, marker=None, timeout: float = 5, start_url: Optional[str] = None) -> bool:
+        """
+        Wait until the signup form moved to its next step
+
+        Returns as soon as `marker` (an element of the current step) goes stale
+        or the URL differs from `start_url`, instead of sleeping a fixed time.
+        Pass the URL read before clicking Next: read here, a navigation that
+        already happened would never register. Returns False on timeout.
+        """
+        if start_url is None:
+            start_url = driver.current_url
+        conditions = [EC.url_changes(start_url)]
+        if marker is not None:
+            conditions.append(EC.staleness_of(marker))
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_until_ready(self, driver, timeout: float = 2):
+        """Wait for document.readyState == 'complete' (gives up silently after timeout)"""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass
+
+    def _wait_for_listbox_closed(self, driver, timeout: float = 1):
+        """Wait for an open dropdown listbox to close after picking an option"""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, "[role='listbox']"))
+            )
+        except TimeoutException:
+            pass
+
+    def _page_text(self, driver, limit: int = 4096) -> str:
+        """First `limit` characters of the page's visible text (sliced in the browser, not after transfer)"""
+        return driver.execute_script(
+            "return ((document.body && document.body.innerText) || '').slice(0, arguments[0])", limit
+        ) or ""
+
+    def _captcha_state(self, driver) -> Dict[str, bool]:
+        """Evaluate the CAPTCHA text/frame/element checks in one script call"""
+        return driver.execute_script(self._CAPTCHA_STATE_JS, _CAPTCHA_RE.pattern)
+
+    def _captcha_cleared(self, driver, captcha_url: str, check_text: bool = True) -> bool:
+        """CAPTCHA poll check: URL moved on, or (with check_text) the first 2000 chars of page text no longer ask to prove you're human"""
+        if driver.current_url != captcha_url:
+            return True
+        return check_text and not _CAPTCHA_RE.search(self._page_text(driver, 2000))
+
+    @classmethod
+    def _email_error(cls, driver) -> Optional[str]:
+        """Return the text of a visible, non-empty username error, or None (one script call over the error elements only)"""
+        return driver.execute_script(
+            cls._EMAIL_ERROR_JS, cls._EMAIL_ERROR_CSS, _TAKEN_RE.pattern, cls._EMAIL_FIELD_ERROR_CSS
+        )
+
+    @classmethod
+    def _email_check_settled(cls, driver) -> bool:
+        """WebDriverWait predicate: email form validated (taken error shown, or Next enabled)"""
+        if cls._email_error(driver):
+            return True
+        buttons = driver.find_elements(By.CSS_SELECTOR, "#iSignupAction, button[type='submit'], input[type='submit']")
+        return any(button.is_enabled() for button in buttons)
+
+    def _take_screenshot(self, driver, name: str, step: bool = False):
+        """Take screenshot for debugging (step=True marks happy-path captures, skipped unless SCREENSHOT_LEVEL is 'always')"""
+        if step and config.SCREENSHOT_LEVEL != "always":
+            return
+        try:
+            # Directory is created on the first capture only, not re-checked for every screenshot
+            if not self._screenshot_dir_ready:
+                os.makedirs(self.SCREENSHOT_DIR, exist_ok=True)
+                self._screenshot_dir_ready = True
+            filename = f"{self.SCREENSHOT_DIR}/{name}_{int(time.time())}"
+            try:
+                # JPEG straight from DevTools is several times smaller and faster to encode than the PNG
+                shot = driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'jpeg', 'quality': 60})
+                filename += ".jpg"
+                with open(filename, 'wb') as f:
+                    f.write(base64.b64decode(shot['data']))
+            except WebDriverException:
+                filename += ".png"
+                driver.save_screenshot(filename)
             logging.info(f"Screenshot saved: {filename}")
         except Exception as e:
             logging.error(f"Failed to save screenshot: {e}")
@@ -1915,56 +1560,44 @@ class OutlookAccountCreator:
         """
         accounts = []
 
-        # Check if file exists to determine if we need to write header
-        import os
-        file_exists = os.path.exists(output_file)
-
-        # Create CSV file with headers only if file doesn't exist
-        if not file_exists:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Email', 'Password', 'First Name', 'Last Name', 'Birth Date'
-                ])
-            logging.info(f"Created new CSV file: {output_file}")
-        else:
-            logging.info(f"Appending to existing CSV file: {output_file}")
-
         logging.info(f"Creating {count} Outlook accounts...")
         if proxy_list:
             logging.info(f"Using {len(proxy_list)} proxies for account creation")
 
-        for i in range(count):
-            logging.info(f"\n[{i+1}/{count}] Creating account...")
+        # CSV and log files stay open for the whole run (header written only for new files)
+        with AccountLog(output_file) as account_log:
+            self.known_emails = account_log
+            delay = config.DELAY_BETWEEN_ACCOUNTS
+            for i in range(count):
+                # DELAY_BETWEEN_ACCOUNTS is the minimum gap between account starts,
+                # so time already spent on the previous account counts towards it
+                deadline = time.monotonic() + delay
+                logging.info(f"\n[{i+1}/{count}] Creating account...")
 
-            # Get proxy for this account if list provided
-            proxy = None
-            if proxy_list and len(proxy_list) > 0:
-                proxy = proxy_list[i % len(proxy_list)]
-                logging.info(f"Using proxy: {proxy}")
+                # Get proxy for this account if list provided
+                proxy = None
+                if proxy_list and len(proxy_list) > 0:
+                    proxy = proxy_list[i % len(proxy_list)]
+                    logging.info(f"Using proxy: {proxy}")
 
-            account = self.create_account(proxy=proxy)
+                account = self.create_account(proxy=proxy)
 
-            if account:
-                accounts.append(account)
+                if account:
+                    accounts.append(account)
 
-                # Save to CSV
-                with open(output_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        account['email'],
-                        account['password'],
-                        account['first_name'],
-                        account['last_name'],
-                        account['birth_date']
-                    ])
+                    # Save to CSV
+                    account_log.log_success(account)
 
-                logging.info(f"✓ Progress: {len(accounts)}/{count} accounts created")
-            else:
-                logging.error(f"✗ Failed to create account {i+1}")
+                    logging.info(f"✓ Progress: {len(accounts)}/{count} accounts created")
+                else:
+                    failed_email, reason = self.last_failure
+                    account_log.log_failure(f"Failed to create account {i+1}/{count} "
+                                            f"({failed_email or 'no email'}): {reason or 'unknown error'}")
+                    logging.error(f"✗ Failed to create account {i+1}")
 
-            # No delay between accounts - create as fast as possible
-            # Each account creation already has built-in delays for page loads
+                slack = deadline - time.monotonic()
+                if slack > 0 and i < count - 1:
+                    time.sleep(slack)
 
         logging.info(f"\n{'='*60}")
         logging.info(f"Account Creation Complete!")
@@ -1977,6 +1610,11 @@ class OutlookAccountCreator:
 
 def main():
     """Main function for standalone usage"""
+    # Configured once for the CLI run (before the creator logs anything), not per instance
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     print("\n" + "="*60)
     print("OUTLOOK EMAIL ACCOUNT CREATOR")
     print("="*60)
@@ -5,9 +5,12 @@ Manages proxy rotation for requests
 """
 
 import logging
+import os
 import random
 import threading
-from typing import List, Optional
+from typing import Sequence, Optional
+
+import config
 
 
 class ProxyManager:
@@ -19,15 +22,11 @@ class ProxyManager:
         self.lock = threading.Lock()
         logging.info(f"Loaded {len(self.proxies)} proxies")
 
-    def _load_proxies(self, proxy_file: str) -> List[str]:
-        """Load proxies from file"""
-        try:
-            with open(proxy_file, 'r') as f:
-                proxies = [line.strip() for line in f if line.strip()]
-            return proxies
-        except FileNotFoundError:
+    def _load_proxies(self, proxy_file: str) -> Sequence[str]:
+        """Load proxies from file (shared, cached tuple - see config.load_proxies)"""
+        if not os.path.exists(proxy_file):
             logging.error(f"Proxy file not found: {proxy_file}")
-            return []
+        return config.load_proxies(proxy_file)
 
     def get_next_proxy(self) -> Optional[str]:
         """Get next proxy in rotation"""
@@ -0,0 +1,127 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import config
+from account_log import CSV_HEADER, AccountIndex, AccountLog
+
+ACCOUNT = {
+    'email': 'anasilva@outlook.com',
+    'password': 'Outlook234!',
+    'first_name': 'Ana',
+    'last_name': 'Silva',
+    'birth_date': '1990-01-02',
+}
+
+
+class TempDirTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        # Keep the success/failure logs inside the temp dir (and in a subdirectory that does not exist yet)
+        for name, file_name in (("SUCCESS_LOG_FILE", "ok.log"), ("FAILED_LOG_FILE", "failed.log")):
+            patcher = mock.patch.object(config, name, os.path.join(self.dir, "logs", file_name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.dir, name)
+
+
+class AccountIndexTest(TempDirTest):
+
+    def test_add_persists_and_dedups(self):
+        index = AccountIndex(self.path("a.idx"))
+        index.add("Ana@Outlook.com ")
+        index.add("ana@outlook.com")
+        index.close()
+        self.assertEqual(os.path.getsize(self.path("a.idx")), AccountIndex.RECORD_SIZE)
+
+        reopened = AccountIndex(self.path("a.idx"))
+        self.addCleanup(reopened.close)
+        self.assertIn("ana@outlook.com", reopened)
+        self.assertNotIn("bob@outlook.com", reopened)
+
+    def test_torn_trailing_record_is_ignored(self):
+        index = AccountIndex(self.path("a.idx"))
+        index.update(["ana@outlook.com", "bob@outlook.com"])
+        index.close()
+        with open(self.path("a.idx"), "ab") as f:
+            f.write(b"\x01\x02\x03")  # Partial record from an interrupted write
+
+        reopened = AccountIndex(self.path("a.idx"))
+        self.addCleanup(reopened.close)
+        self.assertEqual(len(reopened), 2)
+        self.assertIn("bob@outlook.com", reopened)
+
+    def test_empty_index_file(self):
+        open(self.path("a.idx"), "wb").close()
+        index = AccountIndex(self.path("a.idx"))
+        self.addCleanup(index.close)
+        self.assertEqual(len(index), 0)
+
+
+class AccountLogTest(TempDirTest):
+
+    def read_rows(self, name: str):
+        with open(self.path(name), newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    def test_header_written_once(self):
+        for _ in range(2):
+            with AccountLog(self.path("accounts.csv")) as account_log:
+                account_log.log_success(ACCOUNT)
+        rows = self.read_rows("accounts.csv")
+        self.assertEqual(rows[0], CSV_HEADER)
+        self.assertEqual(len(rows), 3)
+        with open(config.SUCCESS_LOG_FILE, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+
+    def test_index_seeded_from_existing_csv(self):
+        with open(self.path("accounts.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            writer.writerow(["old@outlook.com", "p", "Old", "User", "1980-01-01"])
+
+        with AccountLog(self.path("accounts.csv")) as account_log:
+            self.assertIn("old@outlook.com", account_log)
+            self.assertNotIn(ACCOUNT['email'], account_log)
+            account_log.log_success(ACCOUNT)
+            self.assertIn(ACCOUNT['email'], account_log)
+
+        with AccountLog(self.path("accounts.csv")) as account_log:
+            self.assertIn(ACCOUNT['email'], account_log)
+
+    def test_failure_log_created_on_first_record(self):
+        with AccountLog(self.path("accounts.csv")) as account_log:
+            self.assertFalse(os.path.exists(config.FAILED_LOG_FILE))
+            account_log.log_failure("Failed to create account 1/1")
+        with open(config.FAILED_LOG_FILE, encoding="utf-8") as f:
+            self.assertIn("Failed to create account 1/1", f.read())
+
+    def test_failed_seeding_closes_files(self):
+        with open(self.path("accounts.csv"), "w", encoding="utf-8") as f:
+            f.write("email\n")
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            opened.append(real_open(*args, **kwargs))
+            return opened[-1]
+
+        with mock.patch("builtins.open", tracking_open), \
+                mock.patch.object(AccountLog, "_read_csv_emails", side_effect=OSError("boom")), \
+                mock.patch.object(AccountIndex, "close", autospec=True,
+                                  side_effect=AccountIndex.close) as index_close, \
+                self.assertRaises(OSError):
+            AccountLog(self.path("accounts.csv"))
+        self.assertTrue(opened and all(f.closed for f in opened))
+        index_close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import config
+
+try:
+    import yaml
+except ImportError:  # Optional dependency: YAML parsing tests are skipped without it
+    yaml = None
+
+
+class CoerceTest(unittest.TestCase):
+
+    def test_env_strings(self):
+        self.assertIs(config._coerce("headless_mode", "Yes"), True)
+        self.assertIs(config._coerce("headless_mode", "0"), False)
+        self.assertIs(config._coerce("headless_mode", " Off "), False)
+        self.assertIs(config._coerce("headless_mode", ""), False)
+        self.assertEqual(config._coerce("outlook_imap_port", "993"), 993)
+        self.assertEqual(config._coerce("delay_between_accounts", "1.5"), 1.5)
+        self.assertIsNone(config._coerce("total_accounts", "none"))
+        self.assertEqual(config._coerce("blocked_url_patterns", "*.png, ,*.gif"), ("*.png", "*.gif"))
+
+    def test_yaml_scalars(self):
+        self.assertEqual(config._coerce("fixed_password", 12345678), "12345678")
+        self.assertEqual(config._coerce("email_domain", 123), "123")
+        self.assertEqual(config._coerce("outlook_imap_port", 993), 993)
+        self.assertEqual(config._coerce("delay_between_accounts", 3), 3.0)
+        self.assertIs(config._coerce("disable_images", True), True)
+        self.assertIsNone(config._coerce("total_accounts", None))
+        self.assertEqual(config._coerce("blocked_url_patterns", ["*.png", " *.gif "]), ("*.png", "*.gif"))
+
+    def test_rejects_mistyped_values(self):
+        for name, value in (("fixed_password", True), ("outlook_imap_port", 2.5), ("outlook_imap_port", "x"),
+                            ("headless_mode", [1]), ("headless_mode", "ture"), ("headless_mode", 2), ("blocked_url_patterns", 5)):
+            with self.subTest(name=name, value=value), self.assertRaises(ValueError):
+                config._coerce(name, value)
+
+    def test_normalize_ignores_unknown_keys(self):
+        self.assertEqual(config._normalize({"FIXED_PASSWORD": 1234, "nope": 1}, "test"),
+                         {"fixed_password": "1234"})
+
+    def test_env_file_keys_accept_prefix(self):
+        raw = {"OUTLOOK_HEADLESS_MODE": "yes", "PAGE_LOAD_TIMEOUT": "45", "OUTLOOK_IMAP_PORT": "143"}
+        self.assertEqual(config._normalize(raw, ".env", strip_prefix=True),
+                         {"headless_mode": True, "page_load_timeout": 45, "outlook_imap_port": 143})
+
+    def test_from_env(self):
+        cfg = config.Config.from_env(environ={"OUTLOOK_IMAP_PORT": "143", "OUTLOOK_HEADLESS_MODE": "1"})
+        self.assertEqual(cfg.outlook_imap_port, 143)
+        self.assertTrue(cfg.headless_mode)
+
+    def test_post_init_validation(self):
+        with self.assertRaises(ValueError):
+            config.Config(proxy_type="ftp")
+
+
+class YamlCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.yaml_path = os.path.join(self.tmp.name, "outlook_config.yml")
+        self.cache_path = os.path.join(self.tmp.name, "cache.json")
+        patcher = mock.patch.object(config, "CONFIG_CACHE_FILE", self.cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_yaml(self, raw: bytes):
+        with open(self.yaml_path, "wb") as f:
+            f.write(raw)
+
+    def _write_cache(self, raw: bytes, data):
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({"hash": digest, "data": data}, f)
+
+    def test_missing_file(self):
+        self.assertEqual(config._load_yaml_overrides(self.yaml_path), {})
+
+    def test_cache_hit_skips_parsing(self):
+        raw = b"headless_mode: true\n"
+        self._write_yaml(raw)
+        self._write_cache(raw, {"from_cache": 1})
+        self.assertEqual(config._load_yaml_overrides(self.yaml_path), {"from_cache": 1})
+
+    @unittest.skipIf(yaml is None, "PyYAML not installed")
+    def test_changed_file_invalidates_cache(self):
+        self._write_yaml(b"headless_mode: true\n")
+        self._write_cache(b"headless_mode: false\n", {"from_cache": 1})
+        self.assertEqual(config._load_yaml_overrides(self.yaml_path), {"headless_mode": True})
+        with open(self.cache_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["data"], {"headless_mode": True})
+
+    @unittest.skipUnless(yaml is None, "PyYAML installed")
+    def test_changed_file_without_pyyaml_is_ignored(self):
+        self._write_yaml(b"headless_mode: true\n")
+        self._write_cache(b"headless_mode: false\n", {"from_cache": 1})
+        self.assertEqual(config._load_yaml_overrides(self.yaml_path), {})
+
+    def test_non_mapping_cache_is_ignored(self):
+        raw = b"headless_mode: true\n"
+        self._write_yaml(raw)
+        self._write_cache(raw, ["not", "a", "mapping"])
+        with self.assertLogs(config._log, "WARNING"):
+            result = config._load_yaml_overrides(self.yaml_path)
+        self.assertEqual(result, {"headless_mode": True} if yaml else {})
+
+    @unittest.skipIf(yaml is None, "PyYAML not installed")
+    def test_non_mapping_yaml_raises(self):
+        self._write_yaml(b"- a\n- b\n")
+        with self.assertRaisesRegex(ValueError, "outlook_config.yml"):
+            config._load_yaml_overrides(self.yaml_path)
+
+
+
+class ResourceBlockingTest(unittest.TestCase):
+    def _apply(self, **overrides):
+        driver = mock.Mock()
+        with mock.patch.object(config, "CONFIG", dataclasses.replace(config.CONFIG, **overrides)):
+            config.apply_resource_blocking(driver)
+        return driver
+
+    def test_off_sends_nothing(self):
+        self.assertFalse(self._apply(disable_images=False).execute_cdp_cmd.called)
+
+    def test_on_blocks_configured_patterns(self):
+        driver = self._apply(disable_images=True, blocked_url_patterns=("*.woff2",))
+        driver.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': ["*.woff2"]})
+
+    def test_cdp_failure_is_logged(self):
+        driver = mock.Mock()
+        driver.execute_cdp_cmd.side_effect = RuntimeError("no CDP")
+        with mock.patch.object(config, "CONFIG", dataclasses.replace(config.CONFIG, disable_images=True)), \
+                self.assertLogs(config._log, "WARNING"):
+            config.apply_resource_blocking(driver)
+
+
+if __name__ == "__main__":
+    unittest.main()
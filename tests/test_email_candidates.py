@@ -0,0 +1,48 @@
+import unittest
+
+try:
+    from outlook_account_creator import OutlookAccountCreator
+except ImportError:  # Browser dependencies (undetected-chromedriver, selenium, faker) not installed
+    OutlookAccountCreator = None
+
+import config
+
+
+@unittest.skipIf(OutlookAccountCreator is None, "outlook_account_creator dependencies not installed")
+class EmailCandidatesTest(unittest.TestCase):
+
+    def make_creator(self, second_last_names, known=()):
+        creator = OutlookAccountCreator(locale="en_US")
+        names = iter(second_last_names)
+        creator._last_name = lambda: next(names)
+        creator.known_emails = frozenset(known)
+        return creator
+
+    def test_skips_known_emails(self):
+        creator = self.make_creator(["Souza", "Lima"], known=[config.make_email("anasilvasouz")])
+        self.assertEqual(creator._email_for_name("Ana", "Silva"), config.make_email("anasilvalima"))
+
+    def test_short_second_last_name_is_padded(self):
+        creator = self.make_creator(["Ng"])
+        self.assertEqual(creator._email_for_name("Ana", "Silva"), config.make_email("anasilvangxx"))
+
+    def test_returns_none_when_draws_exhausted(self):
+        creator = self.make_creator(["Souza"] * 3, known=[config.make_email("anasilvasouz")])
+        self.assertIsNone(creator._email_for_name("Ana", "Silva", max_draws=3))
+
+    def test_candidates_are_distinct_and_unused(self):
+        known = config.make_email("anasilvasouz")
+        creator = self.make_creator(["Souza", "Lima", "Lima", "Rocha", "Costa"] + ["Souza"] * 40, known=[known])
+        self.assertEqual(creator._email_candidates("Ana", "Silva", 3), [
+            config.make_email("anasilvalima"),
+            config.make_email("anasilvaroch"),
+            config.make_email("anasilvacost"),
+        ])
+
+    def test_candidates_empty_when_pool_runs_dry(self):
+        creator = self.make_creator(["Souza"] * 100, known=[config.make_email("anasilvasouz")])
+        self.assertEqual(creator._email_candidates("Ana", "Silva", 3), [])
+
+
+if __name__ == "__main__":
+    unittest.main()